@@ -1,14 +1,19 @@
 import csv
+import hashlib
+import os
 import random
 from datetime import datetime
 
 from qos_routing_gui import (
-    generate_random_network,
+    generate_network,
+    save_network,
+    load_network,
     compute_total_delay,
     compute_reliability_cost,
     compute_resource_cost,
     compute_total_cost,
     find_best_path_simple,
+    route_batch,
     q_learning_shortest_path,
     sarsa_shortest_path,
 )
@@ -28,10 +33,11 @@ def run_single_algorithm(
     ve yol + metrikleri döner.
     """
 
+    train_info = None
     if alg_name == "Basit":
         path = find_best_path_simple(G, s, d, w_delay, w_rel, w_res)
     elif alg_name == "Q-Learning":
-        path = q_learning_shortest_path(
+        path, train_info = q_learning_shortest_path(
             G,
             source=s,
             target=d,
@@ -44,9 +50,10 @@ def run_single_algorithm(
             gamma=0.9,
             epsilon_start=1.0,
             epsilon_end=0.05,
+            return_info=True,
         )
     elif alg_name == "SARSA":
-        path = sarsa_shortest_path(
+        path, train_info = sarsa_shortest_path(
             G,
             source=s,
             target=d,
@@ -59,6 +66,7 @@ def run_single_algorithm(
             gamma=0.9,
             epsilon_start=1.0,
             epsilon_end=0.05,
+            return_info=True,
         )
     else:
         raise ValueError(f"Bilinmeyen algoritma: {alg_name}")
@@ -73,24 +81,42 @@ def run_single_algorithm(
         total_delay, rel_cost, res_cost, w_delay, w_rel, w_res
     )
 
-    return {
+    result = {
         "path": path,
         "total_delay": total_delay,
         "rel_cost": rel_cost,
         "res_cost": res_cost,
         "total_cost": total_cost,
     }
+    if train_info is not None:
+        result["episodes_run"] = train_info["episodes_run"]
+        result["stop_reason"] = train_info["stop_reason"]
+    return result
+
+
+def _batch_result(paths, metrics, i):
+    """route_batch çıktısının i. çiftini run_single_algorithm biçimine çevirir."""
+    if paths[i] is None:
+        return None
+    result = {"path": paths[i]}
+    for key in ("total_delay", "rel_cost", "res_cost", "total_cost"):
+        result[key] = float(metrics[key][i])
+    return result
 
 
 def run_experiments(
     n_scenarios: int = 20,
     n_repeats: int = 5,
-    n_nodes: int = 250,
-    p: float = 0.4,
+    n_nodes=None,
+    p=None,
     w_delay_raw: float = 5.0,
     w_rel_raw: float = 3.0,
     w_res_raw: float = 2.0,
     output_csv: str = "results_experiments.csv",
+    seed=None,
+    snapshot_dir=None,
+    topology: str = "gnp",
+    topology_params=None,
 ):
     """
     20 farklı senaryo × 5 tekrar şeklinde deneyler yapar.
@@ -101,6 +127,24 @@ def run_experiments(
       - Ağırlıklar GUI'deki varsayılan oranlara göre normalize edilir (5,3,2).
       - Her algoritma (Basit, Q-Learning, SARSA) için yol bulunur ve
         metrikler CSV dosyasına yazılır.
+
+    `seed` verilirse senaryo i'nin ağı `seed + i` ile üretilir, S/D
+    seçimleri aynı tohumdan yapılır ve RL algoritmalarının kullandığı
+    global `random` da her senaryo başında `seed + i` ile tohumlanır;
+    böylece deney (zaman damgaları dışında) birebir tekrarlanabilir.
+
+    `snapshot_dir` verilirse her senaryonun ağı bu klasöre
+    `senaryo_XX_<topoloji>_<etiket>.npz` olarak kaydedilir; etiket `seed`,
+    `topology` ve `topology_params`'tan türetilir. Dosya zaten varsa ağ
+    üretilmez, doğrudan (belleğe eşlenerek) yüklenir. Aynı 20 senaryo
+    böylece aynı ayarlarla yapılan koşularda birebir yeniden oynatılabilir.
+
+    `topology` ağ üretecini seçer ("gnp", "waxman", "ba", "regular",
+    "grid", "torus", "file"); üretece özgü ayarlar `topology_params`
+    sözlüğüyle verilir. `n_nodes` ve `p` yalnızca "gnp" içindir
+    (varsayılan 250 ve 0.4); `topology_params` içindeki farklı bir değerle
+    çelişirlerse ya da başka bir topolojiyle verilirlerse ValueError
+    fırlatılır.
     """
 
     total_runs = n_scenarios * n_repeats
@@ -114,6 +158,28 @@ def run_experiments(
 
     algorithms = ["Basit", "Q-Learning", "SARSA"]
 
+    topology_params = dict(topology_params or {})
+    if topology == "gnp":
+        for name, value, default in (("n_nodes", n_nodes, 250), ("p", p, 0.4)):
+            if value is None:
+                topology_params.setdefault(name, default)
+            elif topology_params.setdefault(name, value) != value:
+                raise ValueError(
+                    f"{name}={value} ile topology_params['{name}']="
+                    f"{topology_params[name]} çelişiyor."
+                )
+    elif n_nodes is not None or p is not None:
+        raise ValueError(
+            f"n_nodes ve p yalnızca 'gnp' topolojisi içindir; '{topology}' "
+            "için ayarları topology_params ile verin."
+        )
+    pair_rng = random.Random(seed)
+    # Anlık görüntü adı ağı belirleyen ayarları taşır; farklı tohum ya da
+    # üreteç ayarlarıyla yapılan koşu eski ağları yeniden oynatmaz.
+    snapshot_tag = hashlib.sha1(
+        repr((topology, sorted(topology_params.items()), seed)).encode("utf-8")
+    ).hexdigest()[:8]
+
     with open(output_csv, mode="w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(
@@ -134,36 +200,73 @@ def run_experiments(
                 "rel_cost",
                 "res_cost",
                 "total_cost",
+                "episodes_run",
+                "stop_reason",
             ]
         )
 
         run_idx = 0
         for scenario_id in range(1, n_scenarios + 1):
             print(f"\nSenaryo {scenario_id}/{n_scenarios} için ağ oluşturuluyor...")
-            G = generate_random_network(n_nodes=n_nodes, p=p)
+            scenario_seed = None if seed is None else seed + scenario_id
+            snapshot = None
+            if snapshot_dir is not None:
+                snapshot = os.path.join(
+                    snapshot_dir,
+                    f"senaryo_{scenario_id:02d}_{topology}_{snapshot_tag}.npz",
+                )
+
+            if snapshot is not None and os.path.exists(snapshot):
+                G, _ = load_network(snapshot)
+            else:
+                G = generate_network(topology, seed=scenario_seed, **topology_params)
+                if snapshot is not None:
+                    os.makedirs(snapshot_dir, exist_ok=True)
+                    save_network(snapshot, G)
 
             nodes = list(G.nodes())
             if len(nodes) < 2:
                 print("  Uyarı: Ağda yeterli düğüm yok, bu senaryo atlanıyor.")
                 continue
 
+            # Rastgele ama farklı kaynak/hedef çiftleri; "Basit" yollar
+            # senaryonun tüm çiftleri için tek seferde hesaplanır.
+            pairs = [pair_rng.sample(nodes, 2) for _ in range(n_repeats)]
+            if scenario_seed is not None:
+                # Q-Learning / SARSA (ve çok yürüyüşçülü RNG) global
+                # `random` modülünden çeker; senaryo başına tohumlanır.
+                random.seed(scenario_seed)
+            simple_paths, simple_metrics = route_batch(
+                G, pairs, (w_delay, w_rel, w_res)
+            )
+
             for repeat_id in range(1, n_repeats + 1):
                 run_idx += 1
                 print(f"  Tekrar {repeat_id}/{n_repeats} (koşu {run_idx}/{total_runs})")
 
-                # Rastgele ama farklı kaynak/hedef seç
-                s, d = random.sample(nodes, 2)
+                s, d = pairs[repeat_id - 1]
 
                 for alg in algorithms:
                     print(f"    Algoritma: {alg} çalıştırılıyor...", end="", flush=True)
-                    result = run_single_algorithm(
-                        alg, G, s, d, w_delay, w_rel, w_res
-                    )
+                    if alg == "Basit":
+                        result = _batch_result(
+                            simple_paths, simple_metrics, repeat_id - 1
+                        )
+                    else:
+                        result = run_single_algorithm(
+                            alg, G, s, d, w_delay, w_rel, w_res
+                        )
                     if result is None:
                         print(" yol bulunamadı.")
                         continue
 
-                    print(" tamam.")
+                    if "episodes_run" in result:
+                        print(
+                            f" tamam ({result['episodes_run']} bölüm, "
+                            f"durma: {result['stop_reason']})."
+                        )
+                    else:
+                        print(" tamam.")
 
                     writer.writerow(
                         [
@@ -171,8 +274,8 @@ def run_experiments(
                             scenario_id,
                             repeat_id,
                             alg,
-                            len(G.nodes()),
-                            len(G.edges()),
+                            G.number_of_nodes(),
+                            G.number_of_edges(),
                             s,
                             d,
                             w_delay,
@@ -183,6 +286,8 @@ def run_experiments(
                             result["rel_cost"],
                             result["res_cost"],
                             result["total_cost"],
+                            result.get("episodes_run", ""),
+                            result.get("stop_reason", ""),
                         ]
                     )
 
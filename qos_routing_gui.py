@@ -1,9 +1,18 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import random
 import math
+import heapq
+import os
+import sys
+import threading
+import weakref
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 import networkx as nx
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
@@ -12,401 +21,3265 @@ from matplotlib.figure import Figure
 # 1) Ağ Oluşturma ve Metrik Hesaplama Fonksiyonları
 # ======================================================
 
-def generate_random_network(n_nodes=250, p=0.4):
-    G = nx.erdos_renyi_graph(n_nodes, p)
+# QoS öznitelik aralıkları (alt, üst) - tüm üreteçler aynı şemayı kullanır
+PROCESSING_DELAY_RANGE = (0.5, 2.0)    # ms
+NODE_RELIABILITY_RANGE = (0.95, 0.999)
+BANDWIDTH_RANGE = (100.0, 1000.0)      # Mbps
+LINK_DELAY_RANGE = (3.0, 15.0)         # ms
+LINK_RELIABILITY_RANGE = (0.95, 0.999)
 
-    if not nx.is_connected(G):
-        largest_cc = max(nx.connected_components(G), key=len)
-        G = G.subgraph(largest_cc).copy()
 
-    for node in G.nodes():
-        processing_delay = random.uniform(0.5, 2.0)  # ms
-        node_reliability = random.uniform(0.95, 0.999)
-        G.nodes[node]["processing_delay"] = processing_delay
-        G.nodes[node]["node_reliability"] = node_reliability
+def _draw_qos_attributes(rng, n_nodes, n_edges):
+    """
+    Düğüm ve kenar özniteliklerini tek seferde, vektörel olarak çeker.
+
+    Dönen sözlükteki her değer bir NumPy dizisidir; düğüm dizileri
+    `n_nodes`, kenar dizileri `n_edges` uzunluğundadır. -log güvenilirlik
+    maliyetleri de burada, üretim anında bir kez hesaplanır.
+    """
+    attrs = {
+        "processing_delay": rng.uniform(*PROCESSING_DELAY_RANGE, size=n_nodes),
+        "node_reliability": rng.uniform(*NODE_RELIABILITY_RANGE, size=n_nodes),
+        "bandwidth": rng.uniform(*BANDWIDTH_RANGE, size=n_edges),
+        "link_delay": rng.uniform(*LINK_DELAY_RANGE, size=n_edges),
+        "link_reliability": rng.uniform(*LINK_RELIABILITY_RANGE, size=n_edges),
+    }
+    return _with_rel_costs(attrs)
+
 
-    for u, v in G.edges():
-        bandwidth = random.uniform(100, 1000)      # Mbps
-        link_delay = random.uniform(3, 15)         # ms
-        link_reliability = random.uniform(0.95, 0.999)
+def _with_rel_costs(attrs):
+    """
+    Güvenilirlik maliyetlerini (-log güvenilirlik) bir kez hesaplayıp
+    `node_rel_cost` / `link_rel_cost` olarak öznitelik sözlüğüne ekler.
+    """
+    attrs["node_rel_cost"] = -np.log(attrs["node_reliability"])
+    attrs["link_rel_cost"] = -np.log(attrs["link_reliability"])
+    return attrs
 
-        G.edges[u, v]["bandwidth"] = bandwidth
-        G.edges[u, v]["link_delay"] = link_delay
-        G.edges[u, v]["link_reliability"] = link_reliability
 
+def _network_from_arrays(nodes, u, v, attrs):
+    """
+    Düğüm etiketleri `nodes` ve (u[i], v[i]) kenarlarından, hazır öznitelik
+    dizileriyle doğrudan bir nx.Graph kurar (alt graf kopyası yok).
+    """
+    G = nx.Graph()
+    G.add_nodes_from(
+        (
+            node,
+            {
+                "processing_delay": proc,
+                "node_reliability": rel,
+                "node_rel_cost": rel_cost,
+            },
+        )
+        for node, proc, rel, rel_cost in zip(
+            nodes,
+            attrs["processing_delay"].tolist(),
+            attrs["node_reliability"].tolist(),
+            attrs["node_rel_cost"].tolist(),
+        )
+    )
+    G.add_edges_from(
+        (
+            a,
+            b,
+            {
+                "bandwidth": bw,
+                "link_delay": delay,
+                "link_reliability": rel,
+                "link_rel_cost": rel_cost,
+            },
+        )
+        for a, b, bw, delay, rel, rel_cost in zip(
+            u,
+            v,
+            attrs["bandwidth"].tolist(),
+            attrs["link_delay"].tolist(),
+            attrs["link_reliability"].tolist(),
+            attrs["link_rel_cost"].tolist(),
+        )
+    )
     return G
 
 
+def _sparse_gnp_edges(n_nodes, p, rng):
+    """
+    G(n, p) kenarlarını geometrik atlama ile üretir (Batagelj & Brandes).
+
+    Olası n(n-1)/2 düğüm çifti doğrusal bir indeksle sıralanır; bir sonraki
+    kenara olan mesafe Geometrik(p) dağılımından çekilir. Böylece iş miktarı
+    O(n + m) olur. Dönüş: w < v olacak şekilde (w, v) int64 dizileri.
+    """
+    n_pairs = n_nodes * (n_nodes - 1) // 2
+    if n_pairs == 0 or p <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    if p >= 1:
+        k = np.arange(n_pairs, dtype=np.int64)
+    else:
+        chunks = []
+        last = -1
+        while True:
+            remaining = n_pairs - last - 1
+            size = int(remaining * p * 1.05) + 1024
+            idx = last + np.cumsum(rng.geometric(p, size=size))
+            idx = idx[idx < n_pairs]
+            chunks.append(idx)
+            if len(idx) < size:
+                break
+            last = int(idx[-1])
+        k = np.concatenate(chunks)
+
+    # k = v(v-1)/2 + w  (0 <= w < v) eşlemesini tersine çevir
+    v = ((1.0 + np.sqrt(1.0 + 8.0 * k)) // 2).astype(np.int64)
+    v[v * (v - 1) // 2 > k] -= 1
+    v[v * (v + 1) // 2 <= k] += 1
+    w = k - v * (v - 1) // 2
+    return w, v
+
+
+def _union_find_labels(n_nodes, u, v):
+    """
+    Kenar listesinden bağlı bileşen etiketlerini union-find ile bulur.
+
+    Birleştirme (kökleri küçük numaralı köke bağlama) ve yol sıkıştırma
+    adımları tüm kenarlar üzerinde vektörel yapılır. Dönüşte her düğümün
+    etiketi, bileşenindeki en küçük düğüm numarasıdır.
+    """
+    parent = np.arange(n_nodes, dtype=np.int64)
+    while True:
+        ru = parent[u]
+        rv = parent[v]
+        differ = ru != rv
+        if not differ.any():
+            return parent
+
+        lo = np.minimum(ru[differ], rv[differ])
+        hi = np.maximum(ru[differ], rv[differ])
+        np.minimum.at(parent, hi, lo)
+
+        # Yol sıkıştırma: herkes doğrudan köküne işaret edene kadar
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+
+def _build_qos_network(n_nodes, u, v, rng, labels=None):
+    """
+    Yapısı (u[i], v[i]) indeks dizileriyle verilen ağdan en büyük bağlı
+    bileşeni union-find ile seçer, QoS özniteliklerini toplu çeker ve
+    sonucu alt graf kopyası yapmadan doğrudan kurar.
+
+    `labels` None ise düğümler bileşen içinde 0..N-1 olarak numaralanır;
+    verilirse (ör. dosyadan okunan ağ) özgün etiketler korunur.
+    """
+    if n_nodes == 0:
+        return nx.Graph()
+
+    components = _union_find_labels(n_nodes, u, v)
+    largest = np.argmax(np.bincount(components, minlength=n_nodes))
+    keep = components == largest
+    new_id = np.cumsum(keep) - 1
+
+    edge_keep = keep[u]
+    u = new_id[u[edge_keep]]
+    v = new_id[v[edge_keep]]
+    n_kept = int(keep.sum())
+
+    attrs = _draw_qos_attributes(rng, n_kept, len(u))
+    if labels is None:
+        return _network_from_arrays(range(n_kept), u.tolist(), v.tolist(), attrs)
+
+    kept_labels = [labels[i] for i in np.flatnonzero(keep).tolist()]
+    return _network_from_arrays(
+        kept_labels,
+        [kept_labels[i] for i in u.tolist()],
+        [kept_labels[i] for i in v.tolist()],
+        attrs,
+    )
+
+
+def _structure_arrays(H):
+    """nx yapı grafından (düğüm_sayısı, u, v) indeks dizileri çıkarır."""
+    index_of = {node: i for i, node in enumerate(H)}
+    m = H.number_of_edges()
+    u = np.fromiter((index_of[a] for a, _ in H.edges()), np.int64, count=m)
+    v = np.fromiter((index_of[b] for _, b in H.edges()), np.int64, count=m)
+    return H.number_of_nodes(), u, v
+
+
+# Topoloji üreteçleri: isim -> fonksiyon(rng, **parametreler)
+# Her üreteç (düğüm_sayısı, u, v) ya da (düğüm_sayısı, u, v, etiketler)
+# döner; QoS öznitelikleri generate_network içinde ortak şemayla atanır.
+TOPOLOGY_GENERATORS = {}
+
+
+def register_topology(name):
+    """Bir fonksiyonu `name` adıyla topoloji üreteci olarak kaydeder."""
+    def decorator(func):
+        TOPOLOGY_GENERATORS[name] = func
+        return func
+    return decorator
+
+
+@register_topology("gnp")
+def _gnp_topology(rng, n_nodes=250, p=0.4, sparse=False):
+    """Erdős–Rényi G(n, p); `sparse=True` ise O(n + m) geometrik atlama."""
+    if sparse:
+        u, v = _sparse_gnp_edges(n_nodes, p, rng)
+        return n_nodes, u, v
+    H = nx.erdos_renyi_graph(n_nodes, p, seed=int(rng.integers(2**32)))
+    return _structure_arrays(H)
+
+
+@register_topology("waxman")
+def _waxman_topology(rng, n_nodes=250, alpha=0.15, beta=0.2):
+    """
+    Waxman: düğümler birim kareye rastgele yerleşir, (u, v) kenarı
+    beta * exp(-d(u, v) / (alpha * L)) olasılıkla eklenir (L = en büyük
+    mesafe). Her satır vektörel işlenir.
+    """
+    coords = rng.uniform(0.0, 1.0, size=(n_nodes, 2))
+    scale = alpha * math.sqrt(2.0)
+
+    us = []
+    vs = []
+    for i in range(n_nodes - 1):
+        dist = np.hypot(*(coords[i + 1:] - coords[i]).T)
+        hit = rng.random(n_nodes - i - 1) < beta * np.exp(-dist / scale)
+        js = np.flatnonzero(hit) + i + 1
+        us.append(np.full(len(js), i, dtype=np.int64))
+        vs.append(js)
+
+    if not us:
+        empty = np.empty(0, dtype=np.int64)
+        return n_nodes, empty, empty
+    return n_nodes, np.concatenate(us), np.concatenate(vs)
+
+
+@register_topology("ba")
+def _barabasi_albert_topology(rng, n_nodes=250, m=3):
+    """Barabási–Albert tercihli bağlanma (her yeni düğüm m kenar ekler)."""
+    H = nx.barabasi_albert_graph(n_nodes, m, seed=int(rng.integers(2**32)))
+    return _structure_arrays(H)
+
+
+@register_topology("regular")
+def _regular_topology(rng, n_nodes=250, degree=6):
+    """Rastgele k-düzenli graf (her düğümün derecesi `degree`)."""
+    H = nx.random_regular_graph(degree, n_nodes, seed=int(rng.integers(2**32)))
+    return _structure_arrays(H)
+
+
+@register_topology("grid")
+def _grid_topology(rng, rows=16, cols=16, periodic=False):
+    """rows x cols ızgara; `periodic=True` ise kenarlar sarılır (torus)."""
+    ids = np.arange(rows * cols).reshape(rows, cols)
+
+    right_u, right_v = ids[:, :-1].ravel(), ids[:, 1:].ravel()
+    down_u, down_v = ids[:-1, :].ravel(), ids[1:, :].ravel()
+    us = [right_u, down_u]
+    vs = [right_v, down_v]
+
+    if periodic:
+        # 2 satır/sütunluk ızgarada sarma kenarı zaten var olan kenarı tekrarlar
+        if cols > 2:
+            us.append(ids[:, -1])
+            vs.append(ids[:, 0])
+        if rows > 2:
+            us.append(ids[-1, :])
+            vs.append(ids[0, :])
+
+    return rows * cols, np.concatenate(us), np.concatenate(vs)
+
+
+@register_topology("torus")
+def _torus_topology(rng, rows=16, cols=16):
+    """Sarmal (periyodik) ızgara."""
+    return _grid_topology(rng, rows=rows, cols=cols, periodic=True)
+
+
+@register_topology("file")
+def _file_topology(rng, path):
+    """
+    GraphML (.graphml) veya GML (.gml) dosyasından topoloji okur
+    (ör. Topology Zoo). Yönlü/çoklu kenarlar tek yönsüz kenara indirgenir,
+    döngüler atılır; dosyadaki düğüm kimlikleri etiket olarak korunur.
+    """
+    lower = path.lower()
+    if lower.endswith(".graphml"):
+        try:
+            H = nx.read_graphml(path, node_type=int)
+        except ValueError:
+            H = nx.read_graphml(path)
+    elif lower.endswith(".gml"):
+        H = nx.read_gml(path, label="id")
+    else:
+        raise ValueError(f"Desteklenmeyen topoloji dosyası: {path}")
+
+    H = nx.Graph(H)
+    H.remove_edges_from(list(nx.selfloop_edges(H)))
+    n_nodes, u, v = _structure_arrays(H)
+    return n_nodes, u, v, list(H.nodes())
+
+
+def generate_network(topology="gnp", seed=None, **params):
+    """
+    Kayıtlı bir topoloji üreteciyle ağ oluşturur.
+
+    - topology: TOPOLOGY_GENERATORS anahtarı ("gnp", "waxman", "ba",
+      "regular", "grid", "torus", "file")
+    - params: üretece özgü parametreler (ör. n_nodes, p, m, degree, path)
+    - Tüm üreteçler aynı QoS şemasını (processing_delay, node_reliability,
+      bandwidth, link_delay, link_reliability) vektörel olarak doldurur ve
+      en büyük bağlı bileşeni döner. Aynı `seed` aynı ağı üretir.
+    """
+    try:
+        generator = TOPOLOGY_GENERATORS[topology]
+    except KeyError:
+        names = ", ".join(sorted(TOPOLOGY_GENERATORS))
+        raise ValueError(f"Bilinmeyen topoloji: {topology} (seçenekler: {names})") from None
+
+    rng = np.random.default_rng(seed)
+    n_nodes, u, v, *labels = generator(rng, **params)
+    return _build_qos_network(n_nodes, u, v, rng, labels[0] if labels else None)
+
+
+def generate_random_network(n_nodes=250, p=0.4, seed=None, sparse=False):
+    """
+    G(n, p) rastgele ağını oluşturup QoS özniteliklerini atar.
+
+    - Bağlı değilse en büyük bağlı bileşen alınır (union-find ile) ve
+      düğümler bileşen içinde 0..N-1 olarak numaralandırılır.
+    - Tüm öznitelikler `seed` ile başlatılan tek bir NumPy Generator'dan
+      toplu olarak çekilir; aynı `seed` her zaman aynı ağı üretir.
+      `seed=None` ise her çağrı farklı bir ağ verir.
+    - `sparse=True`: büyük ve seyrek ağlar (ör. 20k-100k düğüm, ortalama
+      derece 4-20) için O(n + m) mod. Kenarlar nx.erdos_renyi_graph'ın
+      O(n²) döngüsü yerine geometrik atlama ile üretilir.
+    """
+    return generate_network("gnp", seed=seed, n_nodes=n_nodes, p=p, sparse=sparse)
+
+
 def compute_total_delay(G, path):
     if len(path) < 2:
         return 0.0
 
+    if isinstance(G, QoSGraph):
+        idx = G.path_index(path)
+        link_delay_sum = sum(G.link_delay[G.path_edges(idx)].tolist())
+        processing_sum = sum(G.processing_delay[idx[1:-1]].tolist())
+        return link_delay_sum + processing_sum
+
     link_delay_sum = 0.0
     for i in range(len(path) - 1):
         u, v = path[i], path[i + 1]
         link_delay_sum += G.edges[u, v]["link_delay"]
 
-    processing_sum = 0.0
-    for node in path[1:-1]:
-        processing_sum += G.nodes[node]["processing_delay"]
+    processing_sum = 0.0
+    for node in path[1:-1]:
+        processing_sum += G.nodes[node]["processing_delay"]
+
+    return link_delay_sum + processing_sum
+
+
+def _node_rel_cost(data):
+    """Düğümün -log güvenilirlik maliyeti (saklı değilse hesaplanır)."""
+    rel_cost = data.get("node_rel_cost")
+    return -math.log(data["node_reliability"]) if rel_cost is None else rel_cost
+
+
+def _link_rel_cost(data):
+    """Kenarın -log güvenilirlik maliyeti (saklı değilse hesaplanır)."""
+    rel_cost = data.get("link_rel_cost")
+    return -math.log(data["link_reliability"]) if rel_cost is None else rel_cost
+
+
+def compute_reliability_cost(G, path):
+    """
+    Yol boyunca -log güvenilirlik toplamı. Maliyet, yol üzerinde ilerlerken
+    her düğüm ve kenarın saklı `*_rel_cost` değeri eklenerek artımlı kurulur.
+    """
+    if len(path) == 0:
+        return float("inf")
+
+    if isinstance(G, QoSGraph):
+        idx = G.path_index(path)
+        node_costs = G.node_rel_cost[idx].tolist()
+        link_costs = G.link_rel_cost[G.path_edges(idx)].tolist()
+        rel_cost = node_costs[0]
+        for link_cost, node_cost in zip(link_costs, node_costs[1:]):
+            rel_cost += link_cost + node_cost
+        return rel_cost
+
+    rel_cost = _node_rel_cost(G.nodes[path[0]])
+    for i in range(len(path) - 1):
+        u, v = path[i], path[i + 1]
+        rel_cost += _link_rel_cost(G.edges[u, v]) + _node_rel_cost(G.nodes[v])
+
+    return rel_cost
+
+
+def compute_resource_cost(G, path, max_bw=1000.0):
+    if len(path) < 2:
+        return float("inf")
+
+    if isinstance(G, QoSGraph):
+        res_cost = 0.0
+        for bw in G.bandwidth[G.path_edges(G.path_index(path))].tolist():
+            res_cost += max_bw / bw
+        return res_cost
+
+    res_cost = 0.0
+    for i in range(len(path) - 1):
+        u, v = path[i], path[i + 1]
+        bw = G.edges[u, v]["bandwidth"]
+        res_cost += max_bw / bw
+
+    return res_cost
+
+
+def compute_total_cost(delay, rel_cost, res_cost, w_delay, w_rel, w_res):
+    return w_delay * delay + w_rel * rel_cost + w_res * res_cost
+
+
+def compute_path_metrics_batch(G, paths, weights, max_bw=1000.0):
+    """
+    Çok sayıda aday yolu tek seferde puanlar.
+
+    Yollar (n_yol x en_uzun_yol) indeks matrisine açılır, düğüm ve kenar
+    öznitelikleri NumPy ile toplanır. Toplamlar yol boyunca sütun sütun,
+    skaler fonksiyonlarla aynı sırada yapıldığından sonuçlar
+    compute_total_delay / compute_reliability_cost / compute_resource_cost /
+    compute_total_cost ile birebir aynıdır.
+
+    - weights: (w_delay, w_rel, w_res)
+    - Dönüş: "total_delay", "rel_cost", "res_cost", "total_cost" anahtarlı,
+      her biri len(paths) uzunluğunda dizilerden oluşan sözlük.
+    """
+    Q = as_qos_graph(G)
+    w_delay, w_rel, w_res = weights
+
+    n_paths = len(paths)
+    lengths = np.fromiter((len(p) for p in paths), np.int64, count=n_paths)
+    width = int(lengths.max()) if n_paths else 0
+
+    node_mask = np.arange(width) < lengths[:, None]
+    nodes = np.zeros((n_paths, width), dtype=np.int64)
+    nodes[node_mask] = Q.path_index([node for p in paths for node in p])
+
+    hop_mask = node_mask[:, 1:]
+    edges = np.zeros((n_paths, max(width - 1, 0)), dtype=np.int64)
+    edges[hop_mask] = Q.slot_edge[
+        Q.slots(nodes[:, :-1][hop_mask], nodes[:, 1:][hop_mask])
+    ]
+
+    link_delay = np.where(hop_mask, Q.link_delay[edges], 0.0)
+    link_rel_cost = np.where(hop_mask, Q.link_rel_cost[edges], 0.0)
+    res_terms = np.where(hop_mask, max_bw / Q.bandwidth[edges], 0.0)
+    node_rel_cost = np.where(node_mask, Q.node_rel_cost[nodes], 0.0)
+
+    # Ara düğümler: 1 <= j < uzunluk - 1
+    interior = node_mask & (np.arange(width) >= 1) & (
+        np.arange(width) < (lengths - 1)[:, None]
+    )
+    proc_delay = np.where(interior, Q.processing_delay[nodes], 0.0)
+
+    link_delay_sum = np.zeros(n_paths)
+    processing_sum = np.zeros(n_paths)
+    res_cost = np.zeros(n_paths)
+    rel_cost = node_rel_cost[:, 0].copy() if width else np.zeros(n_paths)
+    for j in range(width - 1):
+        link_delay_sum += link_delay[:, j]
+        res_cost += res_terms[:, j]
+        rel_cost += link_rel_cost[:, j] + node_rel_cost[:, j + 1]
+    for j in range(1, width - 1):
+        processing_sum += proc_delay[:, j]
+
+    total_delay = link_delay_sum + processing_sum
+    rel_cost[lengths == 0] = np.inf
+    res_cost[lengths < 2] = np.inf
+
+    return {
+        "total_delay": total_delay,
+        "rel_cost": rel_cost,
+        "res_cost": res_cost,
+        "total_cost": compute_total_cost(
+            total_delay, rel_cost, res_cost, w_delay, w_rel, w_res
+        ),
+    }
+
+
+def find_best_path_simple(
+    G,
+    source,
+    target,
+    w_delay,
+    w_rel,
+    w_res,
+    algorithm: str = "dijkstra",
+    return_info: bool = False,
+    demand_mbps=None,
+    backend: str = "python",
+):
+    """
+    Basit: çok amaçlı maliyeti kenar ağırlığına çevirip Dijkstra ile yol bulma.
+
+    Kenar maliyetleri grafın önbelleğindeki (sürüm, ağırlık üçlüsü) başına
+    bir kez, vektörel olarak hesaplanır ve CSR üzerinde Dijkstra'ya düz
+    ağırlık olarak verilir. G, nx.Graph veya QoSGraph olabilir; nx.Graph
+    canlı öznitelikleri değil önbellekteki QoSGraph görünümü okunur, bu
+    yüzden doğrudan yapılan değişikliklerden sonra `G.graph["version"]`
+    artırılmalıdır (bkz. as_qos_graph).
+
+    - algorithm:
+        "dijkstra"      : tek yönlü Dijkstra (varsayılan)
+        "bidirectional" : kaynak ve hedeften aynı anda iki yönlü Dijkstra
+        "astar"         : A*; alt sınır = en küçük kenar maliyeti x hedefe
+                          BFS atlama sayısı (kabul edilebilir ve tutarlı)
+        "alt"           : landmark alt sınırlarıyla A* (bkz. prepare_alt);
+                          ön işleme yoksa varsayılan ayarlarla bir kez yapılır
+      Tüm modlar aynı optimum maliyeti verir; farkları kesinleşen düğüm
+      sayısıdır. Tek (S, D) sorgusu için en hızlı mod genellikle
+      "bidirectional"dır: ön işleme gerektirmez ve seyrek büyük ağlarda
+      "alt"tan daha az düğüm kesinleştirir.
+    - backend:
+        "python" : yukarıdaki heapq tabanlı aramalar (varsayılan)
+        "scipy"  : (sürüm, ağırlık) başına önbelleğe alınan csr_matrix
+                   üzerinde scipy.sparse.csgraph.dijkstra; yalnızca
+                   "dijkstra" ile kullanılır. "settled" ulaşılan düğüm
+                   sayısıdır (SciPy aramayı hedefte kesmez).
+    - demand_mbps: bant genişliği talebi (Mbps). Verilirse önce en geniş
+      yol ile ulaşılabilir en büyük bant genişliği bulunur; talep bunu
+      aşıyorsa arama yapılmadan None döner. Aksi halde talebin sıralı
+      bant genişliği dizinindeki eşiği O(log m) ile bulunur ve yetersiz
+      bağlantılar arama sırasında (yalnızca ziyaret edilen satırlarda)
+      atlanır; tüm yuvalar için maske kurulmaz.
+    - return_info=True ise (yol, bilgi) döner. bilgi: "cost" (bileşik
+      maliyet), "settled" (kesinleşen düğüm sayısı, kıyaslama için);
+      demand_mbps verilmişse ayrıca "max_bandwidth".
+    """
+    if source == target:
+        path, info = [source], {"cost": 0.0, "settled": 0}
+        if demand_mbps is not None:
+            info["max_bandwidth"] = np.inf
+        return (path, info) if return_info else path
+
+    Q = as_qos_graph(G)
+    try:
+        s_idx, t_idx = Q.index(source), Q.index(target)
+    except KeyError as exc:
+        raise nx.NodeNotFound(f"Düğüm ağda bulunamadı: {exc}") from None
+
+    cost = Q.edge_costs(w_delay, w_rel, w_res)
+    prune = None
+    info = {}
+    if demand_mbps is not None:
+        info["max_bandwidth"] = Q.max_bandwidth(s_idx, t_idx, usable=np.isfinite(cost))
+        if info["max_bandwidth"] < demand_mbps:
+            info.update(cost=np.inf, settled=0)
+            return (None, info) if return_info else None
+        # Budama maske kurulmadan, gevşetme sırasında eşikle yapılır
+        prune = (Q.bandwidth_index()[1], Q.bandwidth_cut(demand_mbps))
+
+    if backend == "scipy":
+        if algorithm != "dijkstra":
+            raise ValueError(f"backend='scipy' yalnızca 'dijkstra' ile çalışır: {algorithm}")
+        _, csgraph_dijkstra = _scipy_csgraph()
+        matrix = Q.cost_matrix(w_delay, w_rel, w_res, demand_mbps=demand_mbps)
+        dist, pred = csgraph_dijkstra(
+            matrix, directed=True, indices=s_idx, return_predecessors=True
+        )
+        idx_path = _path_from_pred(pred, s_idx, t_idx)
+        path_cost = dist[t_idx]
+        settled = int(np.isfinite(dist).sum())
+    elif backend != "python":
+        raise ValueError(f"Bilinmeyen arka uç: {backend}")
+    elif algorithm == "dijkstra":
+        dist, pred, settled = _dijkstra_csr(
+            Q.indptr, Q.indices, cost, s_idx, t_idx, prune=prune
+        )
+        idx_path = _path_from_pred(pred, s_idx, t_idx)
+        path_cost = dist[t_idx]
+    elif algorithm == "bidirectional":
+        # Bir kenarın iki yuvası aynı bant genişliğini (sırasını) taşır
+        rcost = Q.edge_costs(w_delay, w_rel, w_res, reverse=True)
+        idx_path, path_cost, settled = _bidirectional_dijkstra_csr(
+            Q.indptr, Q.indices, cost, rcost, s_idx, t_idx, prune=prune
+        )
+    elif algorithm == "astar":
+        hops = Q.hop_distances(t_idx)
+        finite = cost[np.isfinite(cost)]
+        min_cost = float(finite.min()) if len(finite) else 0.0
+        heuristic = np.where(np.isfinite(hops), hops * min_cost, np.inf)
+        if np.isinf(heuristic[s_idx]):
+            idx_path, path_cost, settled = None, np.inf, 0
+        else:
+            dist, pred, settled = _dijkstra_csr(
+                Q.indptr, Q.indices, cost, s_idx, t_idx,
+                heuristic=heuristic, prune=prune,
+            )
+            idx_path = _path_from_pred(pred, s_idx, t_idx)
+            path_cost = dist[t_idx]
+    elif algorithm == "alt":
+        index = _cached_alt(Q, w_delay, w_rel, w_res)
+        if index is None:
+            index = prepare_alt(Q, w_delay, w_rel, w_res)
+        dist, pred, settled = _dijkstra_csr(
+            Q.indptr, Q.indices, cost, s_idx, t_idx,
+            heuristic=index.lower_bounds(t_idx), prune=prune,
+        )
+        idx_path = _path_from_pred(pred, s_idx, t_idx)
+        path_cost = dist[t_idx]
+    else:
+        raise ValueError(f"Bilinmeyen algoritma: {algorithm}")
+
+    path = None if idx_path is None else Q.path_labels(idx_path)
+    if return_info:
+        info.update(cost=float(path_cost), settled=settled)
+        return path, info
+    return path
+
+
+class _RLEnvironment:
+    """
+    RL hazırlık aşaması: bir çağrının bölümleri boyunca değişmeyen her şey.
+
+    - rewards[k]: k yuvasını seçmenin ödülü (-bileşik kenar maliyeti)
+    - usable: seçilebilir yuvalar (çalışan ve bant genişliği yeterli)
+    - indptr / indices: düz Python listeleri
+    - düğüm başına aksiyon listeleri (ilk ziyarette kurulur)
+    Bölüm döngüsü yalnızca bu listeleri indeksler. Ortam, graf üzerinde
+    (version, ağırlıklar, talep) anahtarıyla önbelleğe alınır; aynı
+    ayarlarla gelen sonraki çağrılar hazırlığı tekrarlamaz.
+    """
+
+    def __init__(self, G, slot_cost, demand_mbps=None):
+        usable = np.isfinite(slot_cost)
+        if demand_mbps is not None:
+            usable &= G.feasible_slots(demand_mbps)
+        self.usable = usable
+        self.reward_array = np.where(usable, -slot_cost, 0.0)
+        self.rewards = self.reward_array.tolist()
+        self.indptr = G.indptr.tolist()
+        self.indices = G.indices.tolist()
+        self.index_array = G.indices
+        self._actions = {}
+
+    def actions(self, u):
+        """u'dan seçilebilecek yuva listesi (CSR sırasında)."""
+        acts = self._actions.get(u)
+        if acts is None:
+            lo = self.indptr[u]
+            acts = (np.flatnonzero(self.usable[lo:self.indptr[u + 1]]) + lo).tolist()
+            self._actions[u] = acts
+        return acts
+
+
+def _rl_environment(G, w_delay, w_rel, w_res, demand_mbps=None):
+    """_RLEnvironment'ı graf önbelleğinden döner, yoksa kurar."""
+    key = (G.version, float(w_delay), float(w_rel), float(w_res), demand_mbps)
+    env = G._rl_cache.get(key)
+    if env is None:
+        env = _RLEnvironment(G, G.edge_costs(w_delay, w_rel, w_res), demand_mbps)
+        G._rl_cache.put(key, env)
+    return env
+
+
+class _SlotQTable:
+    """
+    RL yöntemleri için yuva (CSR yönlü kenar) başına düz Q dizisi.
+
+    Q[k], k = (u -> v) yuvasının değeridir; düğüm u'nun aksiyonları
+    q[indptr[u]:indptr[u + 1]] dilimidir. Kullanılamayan yuvalar (arızalı
+    ya da bant genişliği yetersiz) -inf tutulur, böylece açgözlü seçim ve
+    maksimum doğrudan dilim üzerinde argmax / max ile yapılır. Tekil
+    okuma/yazma aynı belleğe bakan `values` (memoryview) üzerinden,
+    NumPy skaler yükü olmadan yapılır. `tried[k]`, k yuvası en az bir kez
+    güncellendiyse True'dur; eğitim döngüleri bunu `tried_flags`
+    (memoryview) üzerinden işaretler. `initial` = (q, tried) verilirse
+    (sıcak başlangıç) ikisi de onların kopyasından başlar.
+    """
+
+    def __init__(self, env, initial=None):
+        if initial is None:
+            self.q = np.where(env.usable, 0.0, -np.inf)
+            self.tried = np.zeros(len(self.q), dtype=bool)
+        else:
+            self.q = np.array(initial[0], dtype=np.float64)
+            self.tried = np.array(initial[1], dtype=bool)
+        self.values = memoryview(self.q)
+        self.tried_flags = memoryview(self.tried)
+        self.indptr = env.indptr
+        self.actions = env.actions
+
+    def greedy(self, u):
+        lo = self.indptr[u]
+        return lo + int(self.q[lo:self.indptr[u + 1]].argmax())
+
+    def max(self, u):
+        if not self.actions(u):
+            return 0.0
+        return float(self.q[self.indptr[u]:self.indptr[u + 1]].max())
+
+    def epsilon_greedy(self, u, epsilon):
+        acts = self.actions(u)
+        if not acts:
+            return None
+
+        # Rastgele seçim (keşif)
+        if random.random() < epsilon:
+            return random.choice(acts)
+
+        # En iyi aksiyonu seç (sömürü); eşitlikte ilk yuva
+        return self.greedy(u)
+
+
+class _EarlyStopping:
+    """
+    RL eğitimi için isteğe bağlı durma ölçütleri (None = kapalı):
+    - stable_episodes: kaynaktan açgözlü yol K bölümdür aynı ve en az o
+      ana kadarki en iyi bölüm kadar iyi ("stable_path")
+    - q_tol: bir bölümdeki en büyük Q değişimi bu değerin altında ("q_tol")
+    - patience: en iyi toplam ödül N bölümdür iyileşmedi ("patience")
+    Hiçbiri tetiklenmezse eğitim bütçe sonunda biter ("budget").
+    """
+
+    def __init__(
+        self, env, q, tried, s_idx, t_idx, max_steps,
+        stable_episodes=None, q_tol=None, patience=None,
+    ):
+        self.env = env
+        self.q = q
+        self.tried = tried
+        self.s_idx = s_idx
+        self.t_idx = t_idx
+        self.max_steps = max_steps
+        self.stable_episodes = stable_episodes
+        self.q_tol = q_tol
+        self.patience = patience
+        self._last_path = None
+        self._stable = 0
+        self._pending = 0
+        self._since_best = None
+
+    def greedy_path(self, with_reward=False, bound=None):
+        """
+        Kaynaktan açgözlü yol (indeks demeti); hedefe ulaşmazsa None.
+        with_reward=True ise (yol, toplam ödül) döner.
+
+        Yalnızca denenmiş (`tried`) yuvalar ve ziyaret edilmemiş düğümler
+        aday olur. Q başlangıçta 0, tüm ödüller negatif olduğundan
+        denenmemiş yuvalar aksi halde her zaman argmax olur ve yol,
+        düğümün neredeyse tüm yuvaları denenene kadar döngüye girerdi.
+        `bound` verilirse toplam ödül onun altına düştüğü anda None döner.
+        """
+        indptr, indices = self.env.indptr, self.env.indices
+        index_array = self.env.index_array
+        rewards = self.env.rewards
+        node = self.s_idx
+        path = [node]
+        seen = np.zeros(len(indptr) - 1, dtype=bool)
+        seen[node] = True
+        total = 0.0
+        for _ in range(self.max_steps):
+            if node == self.t_idx:
+                break
+            lo, hi = indptr[node], indptr[node + 1]
+            values = self.q[lo:hi]
+            tried = self.tried[lo:hi] & ~seen[index_array[lo:hi]]
+            if not tried.any():
+                node = None
+                break
+            slot = lo + int(np.where(tried, values, -np.inf).argmax())
+            node = indices[slot]
+            total += rewards[slot]
+            if bound is not None and total < bound:
+                node = None
+                break
+            seen[node] = True
+            path.append(node)
+
+        path = tuple(path) if node == self.t_idx else None
+        if with_reward:
+            return path, total
+        return path
+
+    def final_path(self, best_path, best_total):
+        """
+        Eğitim sonunda açgözlü yol, örneklenen en iyi bölümden (best_path,
+        best_total) daha iyiyse onu, değilse best_path'i döner.
+        """
+        greedy, greedy_reward = self.greedy_path(with_reward=True)
+        if greedy is not None and (best_total is None or greedy_reward > best_total):
+            return list(greedy)
+        return best_path
+
+    def check(self, n_episodes, max_delta, improved, best_total=None):
+        """
+        Son `n_episodes` bölümden sonra durma nedeni (yoksa None).
+        best_total: o ana kadarki en iyi bölüm ödülü (yoksa None).
+        """
+        if self.stable_episodes is not None:
+            # Açgözlü yol her bölümde değil, K/4 bölümde bir yeniden çıkarılır
+            self._pending += n_episodes
+            if self._pending >= max(1, self.stable_episodes // 4):
+                path = None
+                if best_total is not None:
+                    path = self.greedy_path(bound=best_total)
+                if path is not None and path == self._last_path:
+                    self._stable += self._pending
+                else:
+                    self._stable = 0
+                self._last_path = path
+                self._pending = 0
+            if self._stable >= self.stable_episodes:
+                return "stable_path"
+
+        if self.q_tol is not None and max_delta < self.q_tol:
+            return "q_tol"
+
+        if self.patience is not None:
+            if improved:
+                self._since_best = 0
+            elif self._since_best is not None:
+                self._since_best += n_episodes
+            if self._since_best is not None and self._since_best >= self.patience:
+                return "patience"
+        return None
+
+
+class _RLRun:
+    """
+    Q-Learning / SARSA çağrılarının ortak kısmı: hazırlık (QoSGraph
+    görünümü, bant genişliği ön kontrolü, ortam, sıcak başlangıç, Q-tablosu,
+    erken durdurma) ve eğitim sonrası sonuç işleme. Eğitim yapılmadan
+    yanıtlanabilen çağrılarda (kaynak = hedef, talep karşılanamaz)
+    `result` hazırlıkta doldurulur.
+    """
+
+    def __init__(
+        self, G, source, target, weights, algorithm, episodes, max_steps,
+        epsilon_start, epsilon_end, demand_mbps, stopping, q_store,
+    ):
+        self.episodes = episodes
+        self.epsilon_start = epsilon_start
+        self.epsilon_end = epsilon_end
+        self.q_store = q_store
+        self.result = None
+
+        if source == target:
+            info = {"episodes_run": 0, "stop_reason": "source_is_target"}
+            if demand_mbps is not None:
+                info["max_bandwidth"] = np.inf
+            self.result = ([source], info)
+            return
+
+        # Komşuluk ve maliyetler QoSGraph görünümünden okunur; arızalı
+        # bağlantı/düğümler aksiyon olarak hiç sunulmaz.
+        self.G = G = as_qos_graph(G)
+        try:
+            self.s_idx, self.t_idx = G.index(source), G.index(target)
+        except KeyError as exc:
+            raise nx.NodeNotFound(f"Düğüm ağda bulunamadı: {exc}") from None
+
+        self.info = {}
+        if demand_mbps is not None:
+            slot_cost = G.edge_costs(*weights)
+            self.info["max_bandwidth"] = G.max_bandwidth(
+                self.s_idx, self.t_idx, usable=np.isfinite(slot_cost)
+            )
+            if self.info["max_bandwidth"] < demand_mbps:
+                self.info.update(episodes_run=0, stop_reason="bandwidth")
+                self.result = (None, self.info)
+                return
+
+        self.env = _rl_environment(G, *weights, demand_mbps)
+        self.store_key = None
+        initial = None
+        if q_store is not None:
+            self.store_key = q_store.key(G, target, weights, algorithm, demand_mbps)
+            initial = q_store.get(self.store_key)
+        self.info["warm_start"] = initial is not None
+        self.table = _SlotQTable(self.env, initial)
+        self.stopper = _EarlyStopping(
+            self.env, self.table.q, self.table.tried, self.s_idx, self.t_idx,
+            max_steps, *stopping,
+        )
+
+    def epsilon(self, ep):
+        """Lineer epsilon azalması."""
+        if self.episodes <= 1:
+            return self.epsilon_end
+        t = ep / (self.episodes - 1)
+        return self.epsilon_start * (1 - t) + self.epsilon_end * t
+
+    def finish(self, best_path, best_total, episodes_run, stop_reason):
+        """Eğitim sonucunu (etiketli yol, bilgi) olarak `result`'a yazar."""
+        if self.q_store is not None or stop_reason == "stable_path":
+            # Sıcak başlangıçta ya da kararlı yolda durulduğunda öğrenilen
+            # politika bu çağrının örneklerinden iyi olabilir; açgözlü yol
+            # da aday olarak değerlendirilir.
+            best_path = self.stopper.final_path(best_path, best_total)
+
+        if best_path is not None:
+            best_path = self.G.path_labels(best_path)
+        self.info.update(episodes_run=episodes_run, stop_reason=stop_reason)
+        if self.q_store is not None:
+            self.q_store.put(self.store_key, self.table.q, self.table.tried)
+        self.result = (best_path, self.info)
+
+    def output(self, return_info):
+        path, info = self.result
+        return (path, info) if return_info else path
+
+
+def q_learning_shortest_path(
+    G,
+    source,
+    target,
+    w_delay,
+    w_rel,
+    w_res,
+    episodes: int = 200,
+    max_steps: int = 200,
+    alpha: float = 0.6,
+    gamma: float = 0.9,
+    epsilon_start: float = 1.0,
+    epsilon_end: float = 0.05,
+    demand_mbps=None,
+    return_info: bool = False,
+    stable_episodes=None,
+    q_tol=None,
+    patience=None,
+    q_store=None,
+):
+    """
+    Basit Q-Learning tabanlı yol bulma.
+
+    - Durumlar: Düğümler
+    - Aksiyonlar: Komşu düğümler (CSR yuvaları)
+    - Ödül: Seçilen kenarın ağırlığına dayalı negatif maliyet
+            (toplam maliyeti minimize etmek için)
+    - Q-tablosu yuva başına düz bir NumPy dizisidir (bkz. _SlotQTable).
+    - demand_mbps: bant genişliği talebi; yetersiz bağlantılar aksiyon
+      olarak sunulmaz, talep en geniş yolu aşıyorsa eğitim yapılmaz.
+    - return_info=True ise (yol, bilgi) döner; demand_mbps verilmişse
+      bilgi "max_bandwidth" içerir.
+    - Erken durdurma (hepsi isteğe bağlı, bkz. _EarlyStopping):
+        stable_episodes: açgözlü yol (denenmiş yuvalar üzerinden, döngüsüz)
+                         bu kadar bölümdür aynıysa ve en iyi bölüm kadar
+                         iyiyse dur; dönen yol o zaman açgözlü yoldur
+        q_tol          : bölümdeki en büyük Q değişimi bunun altındaysa dur
+        patience       : en iyi ödül bu kadar bölümdür iyileşmiyorsa dur
+      return_info=True ise bilgi "episodes_run" ve "stop_reason"
+      ("stable_path", "q_tol", "patience", "budget") içerir.
+    - q_store: QTableStore verilirse aynı hedef / ağırlık / talep için
+      saklanan Q-tablosundan sıcak başlanır, eğitim sonunda tablo depoya
+      yazılır (Q değerleri kaynaktan bağımsız, hedefe kalan maliyettir).
+      Bilgi "warm_start" içerir.
+
+    Not: Bu, eğitim amaçlı basit bir sürümdür; büyük ağlarda /
+    çok sayıda bölümde çalıştırmak maliyetli olabilir.
+    """
+
+    run = _RLRun(
+        G, source, target, (w_delay, w_rel, w_res), "q_learning", episodes,
+        max_steps, epsilon_start, epsilon_end, demand_mbps,
+        (stable_episodes, q_tol, patience), q_store,
+    )
+    if run.result is not None:
+        return run.output(return_info)
+
+    table = run.table
+    q = table.values
+    tried = table.tried_flags
+    rewards = run.env.rewards
+    indices = run.env.indices
+    s_idx, t_idx = run.s_idx, run.t_idx
+    stopper = run.stopper
+
+    best_path = None
+    best_total_reward = None
+
+    episodes_run = 0
+    stop_reason = "budget"
+    for ep in range(episodes):
+        state = s_idx
+        visited = {state}
+        path = [state]
+        total_reward = 0.0
+        max_delta = 0.0
+        epsilon = run.epsilon(ep)
+
+        for _ in range(max_steps):
+            if state == t_idx:
+                break
+
+            slot = table.epsilon_greedy(state, epsilon)
+            if slot is None:
+                break
+            next_state = indices[slot]
+
+            # Aynı düğüm etrafında dönmeyi azaltmak için
+            # zaten ziyaret edilmiş bir düğüme tekrar gitmeyi
+            # biraz cezalandırıyoruz.
+            reward = rewards[slot]
+            if next_state in visited:
+                reward -= 0.1 * abs(reward)
+
+            old_q = q[slot]
+            target_q = reward + gamma * table.max(next_state)
+            new_q = (1 - alpha) * old_q + alpha * target_q
+            q[slot] = new_q
+            tried[slot] = True
+            max_delta = max(max_delta, abs(new_q - old_q))
+
+            total_reward += reward
+            state = next_state
+            path.append(state)
+            visited.add(state)
+
+            if state == t_idx:
+                break
+
+        improved = False
+        if state == t_idx:
+            if best_total_reward is None or total_reward > best_total_reward:
+                best_total_reward = total_reward
+                best_path = path
+                improved = True
+
+        episodes_run += 1
+        reason = stopper.check(1, max_delta, improved, best_total_reward)
+        if reason is not None:
+            stop_reason = reason
+            break
+
+    run.finish(best_path, best_total_reward, episodes_run, stop_reason)
+    return run.output(return_info)
+
+
+def sarsa_shortest_path(
+    G,
+    source,
+    target,
+    w_delay,
+    w_rel,
+    w_res,
+    episodes: int = 200,
+    max_steps: int = 200,
+    alpha: float = 0.6,
+    gamma: float = 0.9,
+    epsilon_start: float = 1.0,
+    epsilon_end: float = 0.05,
+    demand_mbps=None,
+    return_info: bool = False,
+    stable_episodes=None,
+    q_tol=None,
+    patience=None,
+    q_store=None,
+):
+    """
+    SARSA (on-policy) tabanlı basit yol bulma.
+
+    Q-Learning'e benzer, fakat güncellemede bir sonraki
+    durumdaki *seçilen* aksiyonun Q değeri kullanılır.
+    Q-tablosu, demand_mbps, return_info, erken durdurma parametreleri ve
+    q_store q_learning_shortest_path'teki gibidir.
+    """
+
+    run = _RLRun(
+        G, source, target, (w_delay, w_rel, w_res), "sarsa", episodes,
+        max_steps, epsilon_start, epsilon_end, demand_mbps,
+        (stable_episodes, q_tol, patience), q_store,
+    )
+    if run.result is not None:
+        return run.output(return_info)
+
+    table = run.table
+    q = table.values
+    tried = table.tried_flags
+    rewards = run.env.rewards
+    indices = run.env.indices
+    s_idx, t_idx = run.s_idx, run.t_idx
+    stopper = run.stopper
+
+    best_path = None
+    best_total_reward = None
+
+    episodes_run = 0
+    stop_reason = "budget"
+    for ep in range(episodes):
+        episodes_run += 1
+        state = s_idx
+        epsilon = run.epsilon(ep)
+        slot = table.epsilon_greedy(state, epsilon)
+        if slot is None:
+            continue
+
+        visited = {state}
+        path = [state]
+        total_reward = 0.0
+        max_delta = 0.0
+
+        for _ in range(max_steps):
+            if slot is None:
+                break
+            next_state = indices[slot]
+
+            # Çevrimleri azaltmak için tekrar ziyaret cezası
+            reward = rewards[slot]
+            if next_state in visited:
+                reward -= 0.1 * abs(reward)
+
+            if next_state == t_idx:
+                next_slot = None
+            else:
+                next_slot = table.epsilon_greedy(next_state, epsilon)
+
+            old_q = q[slot]
+            if next_slot is None:
+                target_q = reward
+            else:
+                target_q = reward + gamma * q[next_slot]
+
+            new_q = (1 - alpha) * old_q + alpha * target_q
+            q[slot] = new_q
+            tried[slot] = True
+            max_delta = max(max_delta, abs(new_q - old_q))
+
+            total_reward += reward
+            state = next_state
+            path.append(state)
+            visited.add(state)
+            slot = next_slot
+
+            if state == t_idx:
+                break
+
+        improved = False
+        if state == t_idx:
+            if best_total_reward is None or total_reward > best_total_reward:
+                best_total_reward = total_reward
+                best_path = path
+                improved = True
+
+        reason = stopper.check(1, max_delta, improved, best_total_reward)
+        if reason is not None:
+            stop_reason = reason
+            break
+
+    run.finish(best_path, best_total_reward, episodes_run, stop_reason)
+    return run.output(return_info)
+
+
+# ======================================================
+# 2) Dizi Tabanlı Graf Çekirdeği (QoSGraph)
+# ======================================================
+
+_MISSING = object()
+
+
+class _LRUCache:
+    """
+    Girdi sayısı (ve isteğe bağlı bayt) sınırlı LRU sözlük; isabet / ıska /
+    çıkarma sayaçlarını tutar. `sizeof(key, value)` verilirse girdilerin
+    toplam boyutu `nbytes`ta izlenir ve `max_bytes` aşılınca en eski
+    girdiler çıkarılır. QoSGraph önbellekleri, RouteCache ve QTableStore
+    bunu kullanır.
+    """
+
+    def __init__(self, max_items, max_bytes=None, sizeof=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """Değeri döner ve girdiyi en yeni yapar; yoksa `default`."""
+        entry = self._items.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        self.pop(key)
+        size = self.sizeof(key, value) if self.sizeof is not None else 0
+        self._items[key] = (value, size)
+        self.nbytes += size
+
+        while self._items and (
+            len(self._items) > self.max_items
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            _, (_, old_size) = self._items.popitem(last=False)
+            self.nbytes -= old_size
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        entry = self._items.pop(key, None)
+        if entry is None:
+            return default
+        self.nbytes -= entry[1]
+        return entry[0]
+
+    def items(self):
+        return [(key, entry[0]) for key, entry in self._items.items()]
+
+    def retain(self, predicate):
+        """`predicate(key)` yanlış olan girdileri (sayaç artırmadan) siler."""
+        for key in [k for k in self._items if not predicate(k)]:
+            self.pop(key)
+
+    def clear(self):
+        self._items.clear()
+        self.nbytes = 0
+
+    def stats(self, count_name="entries"):
+        """İsabet / ıska / çıkarma sayaçları ve güncel doluluk."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            count_name: len(self._items),
+            "bytes": self.nbytes,
+        }
+
+
+class QoSGraph:
+    """
+    Yönlendirme ve metrik kodu için dizi tabanlı (CSR) graf yapısı.
+
+    - Düğümler 0..n-1 bitişik tamsayı indeksleriyle tutulur; `node_ids[i]`
+      i. düğümün özgün etiketidir. Dış API (yollar, kaynak/hedef) her zaman
+      özgün etiketlerle çalışır.
+    - Komşuluk CSR biçimindedir: i düğümünün komşuları
+      `indices[indptr[i]:indptr[i + 1]]` aralığındadır (artan sırada).
+      Her yönsüz kenar iki yönlü "yuva" (slot) olarak iki kez görünür;
+      `slot_edge[k]` k. yuvanın ait olduğu yönsüz kenarın numarasıdır.
+    - Düğüm öznitelikleri n, kenar öznitelikleri m uzunluğunda bitişik
+      float64 dizileridir. Kenar başına bellek birkaç yüz bayttan
+      ~100 bayta iner (kenar dizileri ~45 bayt, iki yuvanın int32
+      dizileri ve int64 `_slot_key` ~56 bayt).
+    - `version` graf her değiştiğinde artan sayaçtır; türetilmiş yapılar
+      (maliyet dizileri vb.) bu sürümle anahtarlanır.
+    - Bağlantı/düğüm arızaları `edge_active` / `node_active` maskeleriyle
+      tutulur; CSR yapısı hiç yeniden kurulmaz. Arızalı öğelerin maliyeti
+      sonsuzdur. Değişiklikler `subscribe` ile kaydolan dinleyicilere
+      bildirilir.
+    """
+
+    # Önbellekte tutulan en son (ağırlık üçlüsü -> maliyet dizisi) sayısı
+    COST_CACHE_SIZE = 8
+    # Önbellekte tutulan en son (hedef -> BFS atlama dizisi) sayısı
+    HOP_CACHE_SIZE = 16
+    # Önbellekte tutulan ALT ön işleme sonucu (ağırlık üçlüsü başına) sayısı
+    ALT_CACHE_SIZE = 4
+
+    def __init__(
+        self,
+        node_ids,
+        edge_u,
+        edge_v,
+        processing_delay,
+        node_reliability,
+        bandwidth,
+        link_delay,
+        link_reliability,
+        node_rel_cost=None,
+        link_rel_cost=None,
+        csr=None,
+    ):
+        """
+        `csr` verilirse (indptr, indices, slot_edge, slot_reverse) hazır
+        kabul edilir ve sıralama adımı atlanır (ör. kayıtlı ağ yüklenirken).
+        """
+        n = len(node_ids)
+        m = len(edge_u)
+
+        self.node_ids = np.asarray(node_ids)
+        self.edge_u = np.asarray(edge_u, dtype=np.int32)
+        self.edge_v = np.asarray(edge_v, dtype=np.int32)
+
+        self.processing_delay = np.ascontiguousarray(processing_delay, dtype=np.float64)
+        self.node_reliability = np.ascontiguousarray(node_reliability, dtype=np.float64)
+        self.bandwidth = np.ascontiguousarray(bandwidth, dtype=np.float64)
+        self.link_delay = np.ascontiguousarray(link_delay, dtype=np.float64)
+        self.link_reliability = np.ascontiguousarray(link_reliability, dtype=np.float64)
+
+        # -log güvenilirlik maliyetleri: verilmemişse burada bir kez hesaplanır
+        self.node_rel_cost = (
+            -np.log(self.node_reliability) if node_rel_cost is None
+            else np.ascontiguousarray(node_rel_cost, dtype=np.float64)
+        )
+        self.link_rel_cost = (
+            -np.log(self.link_reliability) if link_rel_cost is None
+            else np.ascontiguousarray(link_rel_cost, dtype=np.float64)
+        )
+
+        # Etiket -> indeks eşlemesi; etiketler zaten 0..n-1 ise sözlük tutulmaz
+        self._identity = bool(
+            np.issubdtype(self.node_ids.dtype, np.integer)
+            and np.array_equal(self.node_ids, np.arange(n))
+        )
+        self._labels = self.node_ids.tolist()
+        self._index_of = None if self._identity else {
+            node: i for i, node in enumerate(self._labels)
+        }
+
+        if csr is None:
+            # CSR: her kenar iki yönde, (kaynak, hedef) sırasına göre dizilir
+            src = np.concatenate([self.edge_u, self.edge_v])
+            dst = np.concatenate([self.edge_v, self.edge_u])
+            eid = np.concatenate([np.arange(m), np.arange(m)])
+            order = np.lexsort((dst, src))
+
+            self.indices = dst[order].astype(np.int32)
+            self.slot_edge = eid[order].astype(np.int32)
+            self.indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+
+            # Ters yuva: (a -> b) yuvası için (b -> a) yuvası
+            pair = np.argsort(self.slot_edge, kind="stable").reshape(m, 2)
+            self.slot_reverse = np.empty(2 * m, dtype=np.int32)
+            self.slot_reverse[pair[:, 0]] = pair[:, 1]
+            self.slot_reverse[pair[:, 1]] = pair[:, 0]
+        else:
+            self.indptr, self.indices, self.slot_edge, self.slot_reverse = csr
+
+        self.slot_source = np.repeat(
+            np.arange(n, dtype=np.int32), np.diff(self.indptr)
+        )
+
+        # (kaynak, hedef) -> yuva araması için sıralı anahtarlar
+        self._slot_key = self.slot_source.astype(np.int64) * n + self.indices
+
+        self.edge_active = np.ones(m, dtype=bool)
+        self.node_active = np.ones(n, dtype=bool)
+
+        self.version = 0
+        self._cost_cache = _LRUCache(self.COST_CACHE_SIZE)
+        self._hop_cache = _LRUCache(self.HOP_CACHE_SIZE)
+        self._alt_cache = _LRUCache(self.ALT_CACHE_SIZE)
+        self._matrix_cache = _LRUCache(self.COST_CACHE_SIZE)
+        self._rl_cache = _LRUCache(self.COST_CACHE_SIZE)
+        self._edge_slots = None
+        self._bw_index = None
+        self._listeners = []
+
+    # ---------------- Dönüşümler ----------------
+
+    @classmethod
+    def from_networkx(cls, G):
+        """nx.Graph'i (QoS öznitelikleriyle birlikte) QoSGraph'e çevirir."""
+        node_ids = list(G.nodes())
+        index_of = {node: i for i, node in enumerate(node_ids)}
+
+        n = len(node_ids)
+        m = G.number_of_edges()
+        edge_u = np.empty(m, dtype=np.int32)
+        edge_v = np.empty(m, dtype=np.int32)
+        bandwidth = np.empty(m)
+        link_delay = np.empty(m)
+        link_reliability = np.empty(m)
+        link_rel_cost = np.empty(m)
+
+        for e, (u, v, data) in enumerate(G.edges(data=True)):
+            edge_u[e] = index_of[u]
+            edge_v[e] = index_of[v]
+            bandwidth[e] = data["bandwidth"]
+            link_delay[e] = data["link_delay"]
+            link_reliability[e] = data["link_reliability"]
+            link_rel_cost[e] = _link_rel_cost(data)
+
+        processing_delay = np.fromiter(
+            (G.nodes[node]["processing_delay"] for node in node_ids), float, count=n
+        )
+        node_reliability = np.fromiter(
+            (G.nodes[node]["node_reliability"] for node in node_ids), float, count=n
+        )
+        node_rel_cost = np.fromiter(
+            (_node_rel_cost(G.nodes[node]) for node in node_ids), float, count=n
+        )
+
+        Q = cls(
+            node_ids,
+            edge_u,
+            edge_v,
+            processing_delay,
+            node_reliability,
+            bandwidth,
+            link_delay,
+            link_reliability,
+            node_rel_cost,
+            link_rel_cost,
+        )
+
+        # Arıza işaretleri ("failed": True) maskelere taşınır
+        for e, (_, _, data) in enumerate(G.edges(data=True)):
+            if data.get("failed"):
+                Q.edge_active[e] = False
+        for i, node in enumerate(node_ids):
+            if G.nodes[node].get("failed"):
+                Q.node_active[i] = False
+        return Q
+
+    def to_networkx(self):
+        """Aynı etiket, öznitelik ve arıza işaretleriyle bir nx.Graph döner."""
+        labels = self._labels
+        G = _network_from_arrays(
+            labels,
+            [labels[i] for i in self.edge_u.tolist()],
+            [labels[i] for i in self.edge_v.tolist()],
+            {
+                "processing_delay": self.processing_delay,
+                "node_reliability": self.node_reliability,
+                "bandwidth": self.bandwidth,
+                "link_delay": self.link_delay,
+                "link_reliability": self.link_reliability,
+                "node_rel_cost": self.node_rel_cost,
+                "link_rel_cost": self.link_rel_cost,
+            },
+        )
+        for e in np.flatnonzero(~self.edge_active).tolist():
+            G.edges[labels[self.edge_u[e]], labels[self.edge_v[e]]]["failed"] = True
+        for i in np.flatnonzero(~self.node_active).tolist():
+            G.nodes[labels[i]]["failed"] = True
+        return G
+
+    # ---------------- Sorgular ----------------
+
+    def number_of_nodes(self):
+        return len(self.node_ids)
+
+    def number_of_edges(self):
+        return len(self.edge_u)
+
+    def nodes(self):
+        return self.node_ids.tolist()
+
+    def __contains__(self, node):
+        try:
+            self.index(node)
+        except KeyError:
+            return False
+        return True
+
+    def index(self, node):
+        """Özgün düğüm etiketinin indeksini döner (yoksa KeyError)."""
+        if self._identity:
+            if isinstance(node, (int, np.integer)) and 0 <= node < len(self.node_ids):
+                return int(node)
+            raise KeyError(node)
+        return self._index_of[node]
+
+    def path_index(self, path):
+        """Etiketlerden oluşan yolu indeks dizisine çevirir."""
+        if self._identity:
+            idx = np.asarray(path, dtype=np.int64)
+            if idx.size and (idx.min() < 0 or idx.max() >= len(self.node_ids)):
+                raise KeyError(path)
+            return idx
+        return np.fromiter((self._index_of[node] for node in path), np.int64, count=len(path))
+
+    def path_labels(self, idx_path):
+        """İndeks yolunu özgün etiket listesine çevirir."""
+        if self._identity:
+            return [int(i) for i in idx_path]
+        return [self._labels[i] for i in idx_path]
+
+    def neighbors(self, node, demand_mbps=None):
+        """
+        Bir düğümün çalışan komşularını (etiket olarak) döner. `demand_mbps`
+        verilirse bant genişliği talebi karşılamayan bağlantılar atlanır.
+        """
+        i = self.index(node)
+        if not self.node_active[i]:
+            return []
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        row = self.indices[lo:hi]
+        alive = self.edge_active[self.slot_edge[lo:hi]] & self.node_active[row]
+        if demand_mbps is not None:
+            alive &= self.bandwidth_index()[1][lo:hi] >= self.bandwidth_cut(demand_mbps)
+        return self.path_labels(row[alive])
+
+    def slots(self, src_idx, dst_idx):
+        """
+        İndeks çiftleri için yuva numaralarını vektörel olarak bulur.
+        Bulunamayan çiftlerde KeyError fırlatır.
+        """
+        key = np.asarray(src_idx, dtype=np.int64) * len(self.node_ids) + dst_idx
+        pos = np.searchsorted(self._slot_key, key)
+        pos = np.minimum(pos, len(self._slot_key) - 1)
+        if len(self._slot_key) == 0 or np.any(self._slot_key[pos] != key):
+            raise KeyError("Yolda ağda bulunmayan bir kenar var.")
+        return pos
+
+    def path_edges(self, idx_path):
+        """İndeks yolundaki ardışık düğüm çiftlerinin kenar numaraları."""
+        idx_path = np.asarray(idx_path, dtype=np.int64)
+        return self.slot_edge[self.slots(idx_path[:-1], idx_path[1:])]
+
+    def edge_slots(self, edges):
+        """Kenar numaraları için iki yönlü yuvaları (düz dizi) döner."""
+        if self._edge_slots is None:
+            m = self.number_of_edges()
+            self._edge_slots = np.argsort(self.slot_edge, kind="stable").reshape(m, 2)
+        return self._edge_slots[np.asarray(edges, dtype=np.int64)].ravel()
+
+    def node_slots(self, node_idx):
+        """Düğümlere giren ve çıkan tüm yuvaları döner."""
+        out = _csr_row_slots(self.indptr, node_idx)
+        return np.concatenate([out, self.slot_reverse[out]])
+
+    def hop_distances(self, target_idx):
+        """
+        Çalışan kenarlar üzerinde hedefe BFS atlama sayıları (ulaşılamayan
+        düğümlerde inf). Sonuç (version, hedef) başına önbelleğe alınır.
+        """
+        key = (self.version, target_idx)
+        hops = self._hop_cache.get(key)
+        if hops is not None:
+            return hops
+
+        usable = (
+            self.edge_active[self.slot_edge]
+            & self.node_active[self.slot_source]
+            & self.node_active[self.indices]
+        )
+        hops = np.full(self.number_of_nodes(), np.inf)
+        hops[target_idx] = 0.0
+        frontier = np.array([target_idx], dtype=np.int64)
+        level = 0
+        while len(frontier):
+            level += 1
+            slots = _csr_row_slots(self.indptr, frontier)
+            reached = np.unique(self.indices[slots[usable[slots]]])
+            frontier = reached[np.isinf(hops[reached])]
+            hops[frontier] = level
+
+        hops.setflags(write=False)
+        self._hop_cache.put(key, hops)
+        return hops
+
+    def bandwidth_index(self):
+        """
+        Bant genişliğine göre sıralı kenar dizini: (sorted_bw, slot_rank).
+        sorted_bw artan sıradaki bant genişlikleri, slot_rank[k] ise k.
+        yuvanın kenarının bu sıradaki yeridir. İlk kullanımda O(m log m)
+        kurulur, bant genişliği güncellenene kadar saklanır.
+        """
+        if self._bw_index is None:
+            order = np.argsort(self.bandwidth, kind="stable")
+            edge_rank = np.empty(len(order), dtype=np.int64)
+            edge_rank[order] = np.arange(len(order))
+            self._bw_index = (self.bandwidth[order], edge_rank[self.slot_edge])
+        return self._bw_index
+
+    def bandwidth_cut(self, demand_mbps):
+        """
+        Talebi karşılamayan kenar sayısı (O(log m) ikili arama). Budanmış
+        görünüm bu eşikle tanımlanır: slot_rank >= eşik olan yuvalar uygundur.
+        """
+        sorted_bw, _ = self.bandwidth_index()
+        return int(np.searchsorted(sorted_bw, demand_mbps, side="left"))
+
+    def feasible_slots(self, demand_mbps):
+        """Bant genişliği >= demand_mbps olan yuvaların maskesi."""
+        return self.bandwidth_index()[1] >= self.bandwidth_cut(demand_mbps)
+
+    def max_bandwidth(self, source_idx, target_idx, usable=None):
+        """
+        source -> target arasında ulaşılabilecek en büyük darboğaz bant
+        genişliği (en geniş yol). `usable` yuva maskesi verilmezse arızalı
+        kenar/düğümler hariç tutulur. Ulaşılamıyorsa 0.0 döner.
+        """
+        if source_idx == target_idx:
+            return np.inf
+        if usable is None:
+            usable = (
+                self.edge_active[self.slot_edge]
+                & self.node_active[self.slot_source]
+                & self.node_active[self.indices]
+            )
+        sorted_bw, slot_rank = self.bandwidth_index()
+        width = np.where(usable, slot_rank, -1)
+        best = _widest_path_csr(self.indptr, self.indices, width, source_idx, target_idx)
+        return float(sorted_bw[best]) if best >= 0 else 0.0
+
+    def composite_edge_costs(self, w_delay, w_rel, w_res, slots=None):
+        """
+        find_best_path_simple'daki kenar ağırlığını tüm yönlü yuvalar (ya da
+        yalnızca `slots`) için tek geçişte hesaplar: yuva k = (u -> v) için
+        w_delay * (link_delay + proc(v))
+        + w_rel * (link_rel_cost + node_rel_cost(u) + node_rel_cost(v))
+        + w_res * (1000 / bandwidth).
+        Arızalı kenar ya da uç düğüm içeren yuvaların maliyeti sonsuzdur.
+        """
+        if slots is None:
+            e = self.slot_edge
+            u = self.slot_source
+            v = self.indices
+        else:
+            e = self.slot_edge[slots]
+            u = self.slot_source[slots]
+            v = self.indices[slots]
+
+        total_delay_edge = self.link_delay[e] + self.processing_delay[v]
+        edge_rel_cost = (
+            self.link_rel_cost[e] + self.node_rel_cost[u] + self.node_rel_cost[v]
+        )
+        res_cost = 1000.0 / self.bandwidth[e]
+
+        cost = compute_total_cost(
+            total_delay_edge, edge_rel_cost, res_cost, w_delay, w_rel, w_res
+        )
+        active = self.edge_active[e] & self.node_active[u] & self.node_active[v]
+        return np.where(active, cost, np.inf)
+
+    def edge_costs(self, w_delay, w_rel, w_res, reverse=False):
+        """
+        `composite_edge_costs` sonucunu (version, w_delay, w_rel, w_res)
+        anahtarıyla LRU önbellekte tutar. Aynı ağırlıklarla gelen sorgular
+        maliyet fonksiyonunu yeniden çalıştırmaz. Dönen dizi salt okunurdur.
+
+        reverse=True: k. yuvada ters yöndeki kenarın maliyeti
+        (`cost[slot_reverse]`); hedeften geriye yapılan aramalar içindir.
+        """
+        key = (self.version, float(w_delay), float(w_rel), float(w_res), reverse)
+        cost = self._cost_cache.get(key)
+        if cost is not None:
+            return cost
+
+        if reverse:
+            cost = self.edge_costs(w_delay, w_rel, w_res)[self.slot_reverse]
+        else:
+            cost = self.composite_edge_costs(w_delay, w_rel, w_res)
+        cost.setflags(write=False)
+        self._cost_cache.put(key, cost)
+        return cost
+
+    def cost_matrix(self, w_delay, w_rel, w_res, reverse=False, demand_mbps=None):
+        """
+        `edge_costs` dizisinin scipy.sparse.csr_matrix karşılığı (yönlü,
+        n x n). Sonsuz maliyetli (arızalı) yuvalar matrise konmaz;
+        demand_mbps verilirse bant genişliği yetersiz yuvalar da konmaz.
+        Matris (version, ağırlıklar, yön, bant genişliği eşiği) başına bir
+        kez kurulur ve önbellekte tutulur. SciPy yalnızca bu fonksiyon
+        çağrılınca içe aktarılır.
+        """
+        cut = None if demand_mbps is None else self.bandwidth_cut(demand_mbps)
+        key = (self.version, float(w_delay), float(w_rel), float(w_res), reverse, cut)
+        matrix = self._matrix_cache.get(key)
+        if matrix is not None:
+            return matrix
+
+        csr_matrix, _ = _scipy_csgraph()
+        cost = self.edge_costs(w_delay, w_rel, w_res, reverse=reverse)
+        if cut is not None:
+            cost = np.where(self.bandwidth_index()[1] >= cut, cost, np.inf)
+        matrix = _cost_matrix(csr_matrix, self.indptr, self.indices, cost)
+        self._matrix_cache.put(key, matrix)
+        return matrix
+
+    # ---------------- Değişiklikler ----------------
+
+    def subscribe(self, callback):
+        """
+        Graf her değiştiğinde `callback(graph, change)` çağrılır. `change`
+        sözlüğü: "version", "kind" ("fail", "restore", "update"), etkilenen
+        "edges" / "nodes" indeksleri, maliyeti değişen "slots" ve güncellenen
+        öznitelik adları "attrs".
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _edge_index(self, u, v):
+        return int(self.slot_edge[self.slots(self.index(u), self.index(v))])
+
+    def _commit(self, kind, edges=(), nodes=(), attrs=()):
+        """
+        Sürümü artırır, önbellekteki maliyet dizilerinde yalnızca etkilenen
+        yuvaları yeniden hesaplar ve dinleyicileri bilgilendirir.
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        nodes = np.asarray(nodes, dtype=np.int64)
+        slots = np.unique(np.concatenate([self.edge_slots(edges), self.node_slots(nodes)]))
+        if len(nodes):
+            # Düğüm değişikliği, ona bağlı tüm kenarları da etkiler
+            edges = np.unique(np.concatenate([edges, self.slot_edge[slots]]))
+
+        old_version = self.version
+        self.version += 1
+
+        cached = self._cost_cache.items()
+        self._cost_cache.clear()
+        # Etkilenen yuva kümesi ters yuvalara göre kapalıdır; ters maliyet
+        # dizileri de aynı yuvalarda yenilenir.
+        for (version, w_delay, w_rel, w_res, reverse), cost in cached:
+            if version != old_version:
+                continue
+            source_slots = self.slot_reverse[slots] if reverse else slots
+            cost.setflags(write=True)
+            cost[slots] = self.composite_edge_costs(
+                w_delay, w_rel, w_res, slots=source_slots
+            )
+            cost.setflags(write=False)
+            self._cost_cache.put((self.version, w_delay, w_rel, w_res, reverse), cost)
+        self._hop_cache.clear()
+        self._alt_cache.clear()
+        self._matrix_cache.clear()
+        self._rl_cache.clear()
+        if "bandwidth" in attrs:
+            self._bw_index = None
+
+        change = {
+            "version": self.version,
+            "kind": kind,
+            "edges": edges,
+            "nodes": nodes,
+            "slots": slots,
+            "attrs": tuple(attrs),
+        }
+        for callback in list(self._listeners):
+            callback(self, change)
+        return change
+
+    def fail_link(self, u, v):
+        """(u, v) bağlantısını arızalı işaretler."""
+        e = self._edge_index(u, v)
+        self.edge_active[e] = False
+        return self._commit("fail", edges=[e])
+
+    def restore_link(self, u, v):
+        """Arızalı (u, v) bağlantısını geri getirir."""
+        e = self._edge_index(u, v)
+        self.edge_active[e] = True
+        return self._commit("restore", edges=[e])
+
+    def fail_node(self, node):
+        """Düğümü (ve dolayısıyla tüm bağlantılarını) devre dışı bırakır."""
+        i = self.index(node)
+        self.node_active[i] = False
+        return self._commit("fail", nodes=[i])
+
+    def restore_node(self, node):
+        """Arızalı düğümü geri getirir."""
+        i = self.index(node)
+        self.node_active[i] = True
+        return self._commit("restore", nodes=[i])
+
+    def update_link(self, u, v, **attrs):
+        """
+        Bağlantı özniteliklerini yerinde günceller (bandwidth, link_delay,
+        link_reliability). Güvenilirlik maliyeti de yenilenir.
+        """
+        _check_attrs(attrs, _LINK_ATTRS)
+        e = self._edge_index(u, v)
+        for name, value in attrs.items():
+            getattr(self, name)[e] = value
+        if "link_reliability" in attrs:
+            self.link_rel_cost[e] = -math.log(attrs["link_reliability"])
+        return self._commit("update", edges=[e], attrs=attrs)
+
+    def update_node(self, node, **attrs):
+        """
+        Düğüm özniteliklerini yerinde günceller (processing_delay,
+        node_reliability). Güvenilirlik maliyeti de yenilenir.
+        """
+        _check_attrs(attrs, _NODE_ATTRS)
+        i = self.index(node)
+        for name, value in attrs.items():
+            getattr(self, name)[i] = value
+        if "node_reliability" in attrs:
+            self.node_rel_cost[i] = -math.log(attrs["node_reliability"])
+        return self._commit("update", nodes=[i], attrs=attrs)
+
+
+# Yerinde güncellenebilen öznitelikler
+_LINK_ATTRS = ("bandwidth", "link_delay", "link_reliability")
+_NODE_ATTRS = ("processing_delay", "node_reliability")
+
+
+def _check_attrs(attrs, allowed):
+    unknown = set(attrs) - set(allowed)
+    if unknown:
+        raise ValueError(f"Güncellenemeyen öznitelik: {sorted(unknown)}")
+
+
+# nx.Graph -> QoSGraph dönüşümleri; graf nesnesi yaşadığı sürece saklanır
+_QOS_GRAPH_CACHE = weakref.WeakKeyDictionary()
+
+
+def graph_version(G):
+    """Grafın sürüm sayacı (nx.Graph için `G.graph["version"]`, yoksa 0)."""
+    if isinstance(G, QoSGraph):
+        return G.version
+    return G.graph.get("version", 0)
+
+
+def as_qos_graph(G):
+    """
+    G'yi QoSGraph olarak döner. nx.Graph dönüşümü önbelleğe alınır ve
+    graf sürümü ya da düğüm/kenar sayısı değişene kadar yeniden kullanılır.
+
+    Sözleşme: nx.Graph yalnızca değişiklik API'si (fail_link,
+    restore_link, fail_node, restore_node, update_link, update_node)
+    ile değiştirilmelidir; bu işlevler sürümü artırır ve önbellekteki
+    görünümü artımlı günceller. Öznitelikler doğrudan yazılırsa
+    (`G.edges[u, v]["delay"] = ...`) ya da düğüm/kenar sayısını koruyan
+    yapısal bir değişiklik yapılırsa (bir kenarı silip başka bir kenar
+    eklemek gibi) bu fark edilemez; ardından `G.graph["version"]`
+    artırılmalıdır, aksi halde yönlendirme ve metrikler eski dönüşüm
+    üzerinden (eski verilerle) hesaplanmaya devam eder.
+    """
+    if isinstance(G, QoSGraph):
+        return G
+
+    version = graph_version(G)
+    cached = _QOS_GRAPH_CACHE.get(G)
+    if (
+        cached is not None
+        and cached[0] == version
+        and cached[1].number_of_nodes() == G.number_of_nodes()
+        and cached[1].number_of_edges() == G.number_of_edges()
+    ):
+        return cached[1]
+
+    Q = QoSGraph.from_networkx(G)
+    _QOS_GRAPH_CACHE[G] = (version, Q)
+    return Q
+
+
+def _mutate(G, method, nx_update, *args, **attrs):
+    """
+    QoSGraph'te değişikliği doğrudan uygular. nx.Graph'te önce nx
+    özniteliklerini günceller (`nx_update`), sürümü artırır; önbellekte
+    geçerli bir QoSGraph görünümü varsa değişiklik ona da artımlı uygulanır
+    ve yeniden dönüştürme yapılmaz.
+    """
+    if isinstance(G, QoSGraph):
+        return getattr(G, method)(*args, **attrs)
+
+    version = graph_version(G)
+    cached = _QOS_GRAPH_CACHE.get(G)
+    nx_update()
+    G.graph["version"] = version + 1
+
+    if cached is None or cached[0] != version:
+        return None
+    change = getattr(cached[1], method)(*args, **attrs)
+    _QOS_GRAPH_CACHE[G] = (version + 1, cached[1])
+    return change
+
+
+def fail_link(G, u, v):
+    """(u, v) bağlantısını arızalı işaretler; yapı silinmez, geri alınabilir."""
+    def nx_update():
+        G.edges[u, v]["failed"] = True
+    return _mutate(G, "fail_link", nx_update, u, v)
+
+
+def restore_link(G, u, v):
+    """fail_link ile kapatılan bağlantıyı geri getirir."""
+    def nx_update():
+        G.edges[u, v].pop("failed", None)
+    return _mutate(G, "restore_link", nx_update, u, v)
+
+
+def fail_node(G, node):
+    """Düğümü arızalı işaretler; tüm bağlantıları yönlendirmeden çıkar."""
+    def nx_update():
+        G.nodes[node]["failed"] = True
+    return _mutate(G, "fail_node", nx_update, node)
+
+
+def restore_node(G, node):
+    """fail_node ile kapatılan düğümü geri getirir."""
+    def nx_update():
+        G.nodes[node].pop("failed", None)
+    return _mutate(G, "restore_node", nx_update, node)
+
+
+def update_link(G, u, v, **attrs):
+    """Bağlantı özniteliklerini (bandwidth, link_delay, link_reliability) günceller."""
+    _check_attrs(attrs, _LINK_ATTRS)
+
+    def nx_update():
+        data = G.edges[u, v]
+        data.update(attrs)
+        if "link_reliability" in attrs:
+            data["link_rel_cost"] = -math.log(attrs["link_reliability"])
+    return _mutate(G, "update_link", nx_update, u, v, **attrs)
+
+
+def update_node(G, node, **attrs):
+    """Düğüm özniteliklerini (processing_delay, node_reliability) günceller."""
+    _check_attrs(attrs, _NODE_ATTRS)
+
+    def nx_update():
+        data = G.nodes[node]
+        data.update(attrs)
+        if "node_reliability" in attrs:
+            data["node_rel_cost"] = -math.log(attrs["node_reliability"])
+    return _mutate(G, "update_node", nx_update, node, **attrs)
+
+
+def subscribe(G, callback):
+    """
+    G'nin değişikliklerine abone olur (bkz. QoSGraph.subscribe). nx.Graph
+    için abonelik önbellekteki QoSGraph görünümüne yapılır; graf bu
+    modülün değişiklik fonksiyonları dışında yapısal olarak değiştirilirse
+    görünüm yeniden kurulur ve abonelik düşer.
+    """
+    as_qos_graph(G).subscribe(callback)
+
+
+def _csr_row_slots(indptr, rows):
+    """Verilen satırların (düğümlerin) tüm yuva numaralarını tek dizide döner."""
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def _dijkstra_csr(
+    indptr, indices, cost, source, target=None, heuristic=None, prune=None
+):
+    """
+    CSR komşuluk (indptr, indices) ve yuva maliyet dizisiyle heapq Dijkstra.
+
+    `source`/`target` indekstir. `target` verilirse ona ulaşınca durur.
+    `heuristic` (düğüm başına tutarlı bir alt sınır dizisi) verilirse arama
+    A* olur: yığın anahtarı dist + heuristic.
+    `prune` = (slot_rank, cut) verilirse slot_rank < cut olan yuvalar
+    (bant genişliği yetersiz) gevşetme sırasında atlanır.
+    Dönüş: (dist, pred, settled); ulaşılamayan düğümlerde dist=inf,
+    pred=-1; settled kesinleşen düğüm sayısıdır.
+    """
+    n = len(indptr) - 1
+
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    done = np.zeros(n, dtype=bool)
+    dist[source] = 0.0
+    settled = 0
+
+    heap = [(0.0, source)]
+    while heap:
+        _, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        settled += 1
+        if u == target:
+            break
+
+        lo, hi = indptr[u], indptr[u + 1]
+        row = indices[lo:hi]
+        cand = dist[u] + cost[lo:hi]
+        better = (cand < dist[row]) & ~done[row]
+        if prune is not None:
+            better &= prune[0][lo:hi] >= prune[1]
+        if not better.any():
+            continue
+
+        row = row[better]
+        cand = cand[better]
+        dist[row] = cand
+        pred[row] = u
+        keys = cand if heuristic is None else cand + heuristic[row]
+        for key, v in zip(keys.tolist(), row.tolist()):
+            heapq.heappush(heap, (key, v))
+
+    return dist, pred, settled
+
+
+def _widest_path_csr(indptr, indices, width, source, target):
+    """
+    En geniş yol (max-min) araması. `width` yuva başına tamsayı genişliktir
+    (kullanılamayan yuvalarda -1); bir yolun genişliği en dar yuvasıdır.
+    Dönüş: hedefe ulaşan en büyük genişlik (ulaşılamıyorsa -1).
+    """
+    n = len(indptr) - 1
+    best = np.full(n, -1, dtype=np.int64)
+    done = np.zeros(n, dtype=bool)
+    best[source] = np.iinfo(np.int64).max
+
+    heap = [(-best[source], source)]
+    while heap:
+        _, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+
+        lo, hi = indptr[u], indptr[u + 1]
+        row = indices[lo:hi]
+        cand = np.minimum(width[lo:hi], best[u])
+        better = (cand > best[row]) & ~done[row]
+        if not better.any():
+            continue
+
+        row = row[better]
+        cand = cand[better]
+        best[row] = cand
+        for w, v in zip(cand.tolist(), row.tolist()):
+            heapq.heappush(heap, (-w, v))
+
+    return int(best[target])
+
+
+def _bidirectional_dijkstra_csr(indptr, indices, cost, rcost, source, target, prune=None):
+    """
+    İki yönlü Dijkstra: kaynaktan `cost`, hedeften ters yön maliyetleri
+    `rcost` ile aynı anda arar; her adımda yığın tepesi küçük olan taraf
+    genişletilir. İki tepe toplamı bulunan en iyi buluşma maliyetini
+    aşınca durur. `prune` _dijkstra_csr'daki gibidir.
+    Dönüş: (indeks yolu ya da None, maliyet, settled)
+    """
+    n = len(indptr) - 1
+    costs = (cost, rcost)
+    dist = (np.full(n, np.inf), np.full(n, np.inf))
+    pred = (np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64))
+    done = (np.zeros(n, dtype=bool), np.zeros(n, dtype=bool))
+    heaps = ([(0.0, source)], [(0.0, target)])
+    dist[0][source] = 0.0
+    dist[1][target] = 0.0
+
+    best = np.inf
+    meet = None
+    settled = 0
+
+    while heaps[0] and heaps[1]:
+        top_f, top_b = heaps[0][0][0], heaps[1][0][0]
+        if top_f + top_b >= best:
+            break
+
+        side = 0 if top_f <= top_b else 1
+        d_u, u = heapq.heappop(heaps[side])
+        if done[side][u]:
+            continue
+        done[side][u] = True
+        settled += 1
+
+        lo, hi = indptr[u], indptr[u + 1]
+        row = indices[lo:hi]
+        cand = d_u + costs[side][lo:hi]
+        if prune is not None:
+            cand = np.where(prune[0][lo:hi] >= prune[1], cand, np.inf)
+
+        # Karşı tarafın ulaştığı komşular üzerinden buluşma
+        through = cand + dist[1 - side][row]
+        k = int(np.argmin(through)) if len(row) else -1
+        if k >= 0 and through[k] < best:
+            best = float(through[k])
+            meet = (side, u, int(row[k]))
+
+        better = (cand < dist[side][row]) & ~done[side][row]
+        if not better.any():
+            continue
+        row = row[better]
+        cand = cand[better]
+        dist[side][row] = cand
+        pred[side][row] = u
+        for d_v, v in zip(cand.tolist(), row.tolist()):
+            heapq.heappush(heaps[side], (d_v, v))
+
+    if meet is None:
+        return None, np.inf, settled
+
+    side, u, v = meet
+    # İleri taraftaki uç a, geri taraftaki uç b: source .. a -> b .. target
+    a, b = (u, v) if side == 0 else (v, u)
+    head = _path_from_pred(pred[0], source, a)
+    tail = [b]
+    while tail[-1] != target:
+        tail.append(int(pred[1][tail[-1]]))
+    return head + tail, best, settled
+
+
+def _scipy_csgraph():
+    """SciPy'yi ilk kullanımda içe aktarır: (csr_matrix, csgraph.dijkstra)."""
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import dijkstra
+    except ImportError:
+        raise ImportError(
+            "backend='scipy' için SciPy gerekli; 'pip install scipy' ile kurunuz."
+        ) from None
+    return csr_matrix, dijkstra
+
+
+def _cost_matrix(csr_matrix, indptr, indices, cost):
+    """CSR yuva maliyetlerinden, sonsuz yuvaları atarak csr_matrix kurar."""
+    n = len(indptr) - 1
+    keep = np.isfinite(cost)
+    if not keep.all():
+        indptr = np.concatenate([[0], np.cumsum(keep)])[indptr]
+        indices = indices[keep]
+        cost = cost[keep]
+    return csr_matrix((np.asarray(cost, dtype=np.float64), indices, indptr), shape=(n, n))
+
+
+def _path_from_pred(pred, source, target):
+    """Öncül dizisinden source -> target indeks yolunu çıkarır (yoksa None)."""
+    if source == target:
+        return [source]
+    if pred[target] < 0:
+        return None
+    path = [target]
+    node = target
+    while node != source:
+        node = int(pred[node])
+        path.append(node)
+    path.reverse()
+    return path
+
+
+# ======================================================
+# 2.1) Ağ Anlık Görüntüsü (Kaydet / Yükle)
+# ======================================================
+
+# Anlık görüntüde saklanan diziler; isimler QoSGraph alanlarıyla aynıdır
+_SNAPSHOT_ARRAYS = (
+    "node_ids",
+    "edge_u",
+    "edge_v",
+    "processing_delay",
+    "node_reliability",
+    "node_rel_cost",
+    "bandwidth",
+    "link_delay",
+    "link_reliability",
+    "link_rel_cost",
+    "indptr",
+    "indices",
+    "slot_edge",
+    "slot_reverse",
+    "edge_active",
+    "node_active",
+)
+
+
+def save_network(path, G, pos=None):
+    """
+    Ağı (düğümler, CSR kenarlar, tüm öznitelikler ve isteğe bağlı yerleşim)
+    sıkıştırılmamış bir .npz dosyasına yazar. Her dizi dosyada bitişik
+    durduğundan load_network ile doğrudan belleğe eşlenebilir.
+
+    - G: nx.Graph veya QoSGraph
+    - pos: {düğüm: (x, y)} yerleşimi (ör. spring_layout çıktısı) veya None
+    - Grafın güncel sürümü için hazırlanmış ALT ön işlemeleri (prepare_alt)
+      de dosyaya yazılır ve load_network ile geri yüklenir.
+    """
+    Q = as_qos_graph(G)
+    if Q.node_ids.dtype == object:
+        raise ValueError("Kayıt için düğüm etiketleri tamsayı veya metin olmalıdır.")
+
+    arrays = {name: getattr(Q, name) for name in _SNAPSHOT_ARRAYS}
+    if pos is not None:
+        arrays["pos"] = np.array([pos[node] for node in Q.nodes()], dtype=np.float64)
+
+    # Güncel sürüme ait ALT ön işlemeleri de ağla birlikte saklanır
+    alt_indexes = [
+        index for key, index in Q._alt_cache.items() if key[0] == Q.version
+    ]
+    for i, index in enumerate(alt_indexes):
+        arrays[f"alt{i}_weights"] = np.array(index.weights)
+        arrays[f"alt{i}_landmarks"] = index.landmarks
+        arrays[f"alt{i}_dist_from"] = index.dist_from
+        arrays[f"alt{i}_dist_to"] = index.dist_to
+
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+
+def _npz_memmap(path):
+    """
+    Sıkıştırılmamış .npz üyelerini kopyalamadan np.memmap olarak açar.
+    Sıkıştırılmış üyeler normal yolla okunur. Eşleme "c" (yazınca kopyala)
+    kipindedir: yerinde güncellemeler dosyayı değiştirmez.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with zf.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+
+            # Yerel dosya başlığı: 30 bayt + dosya adı + ek alan
+            f.seek(info.header_offset)
+            local_header = f.read(30)
+            name_len = int.from_bytes(local_header[26:28], "little")
+            extra_len = int.from_bytes(local_header[28:30], "little")
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="c",
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran else "C",
+                )
+    return arrays
+
+
+def load_network(path, mmap=True, networkx=False):
+    """
+    save_network ile yazılmış ağı yükler; üretim ve yerleşim maliyeti ödenmez.
+
+    - mmap=True: diziler dosyadan belleğe eşlenir (büyük ağlar anında açılır).
+    - networkx=True: QoSGraph yerine nx.Graph döner (GUI çizimi için).
+    - Dönüş: (G, pos); pos kayıtta yoksa None, varsa {düğüm: (x, y)}.
+    """
+    if mmap:
+        arrays = _npz_memmap(path)
+    else:
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+
+    Q = QoSGraph(
+        arrays["node_ids"],
+        arrays["edge_u"],
+        arrays["edge_v"],
+        arrays["processing_delay"],
+        arrays["node_reliability"],
+        arrays["bandwidth"],
+        arrays["link_delay"],
+        arrays["link_reliability"],
+        node_rel_cost=arrays["node_rel_cost"],
+        link_rel_cost=arrays["link_rel_cost"],
+        csr=(
+            arrays["indptr"],
+            arrays["indices"],
+            arrays["slot_edge"],
+            arrays["slot_reverse"],
+        ),
+    )
+
+    for name in ("edge_active", "node_active"):
+        if name in arrays:
+            getattr(Q, name)[:] = arrays[name]
+
+    i = 0
+    while f"alt{i}_weights" in arrays:
+        _store_alt(Q, ALTIndex(
+            tuple(float(w) for w in arrays[f"alt{i}_weights"]),
+            arrays[f"alt{i}_landmarks"],
+            arrays[f"alt{i}_dist_from"],
+            arrays[f"alt{i}_dist_to"],
+        ))
+        i += 1
+
+    pos = None
+    if "pos" in arrays:
+        pos = dict(zip(Q.nodes(), np.asarray(arrays["pos"])))
+
+    if networkx:
+        # Yüklenen QoSGraph (ALT indeksleriyle) nx grafın görünümü olarak
+        # kaydedilir; as_qos_graph onu yeniden dönüştürmez.
+        G = Q.to_networkx()
+        _QOS_GRAPH_CACHE[G] = (graph_version(G), Q)
+        return G, pos
+    return Q, pos
+
+
+# ======================================================
+# 2.2) Tüm Çiftler Yol Tablosu (süreç havuzu)
+# ======================================================
+
+# Her işçi sürecine başlangıçta bir kez gönderilen CSR dizileri
+_ROUTE_WORKER_STATE = {}
+
+
+def _route_worker_init(indptr, indices, cost):
+    # Tam ağaç taramasında satır başına NumPy çağrısı yerine düz Python
+    # listeleri daha hızlıdır; dönüşüm işçi başına bir kez yapılır.
+    _ROUTE_WORKER_STATE["csr"] = (indptr.tolist(), indices.tolist(), cost.tolist())
+
+
+def _dijkstra_lists(indptr, indices, cost, source, targets=None):
+    """
+    _dijkstra_csr'ın liste tabanlı sürümü; (dist, pred) listeleri döner.
+    `targets` (indeks kümesi) verilirse hepsi kesinleşince durur, yoksa
+    tam ağaç kurulur.
+    """
+    n = len(indptr) - 1
+    inf = float("inf")
+    dist = [inf] * n
+    pred = [-1] * n
+    done = [False] * n
+    dist[source] = 0.0
+    remaining = None if targets is None else set(targets)
+
+    heap = [(0.0, source)]
+    while heap:
+        d_u, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            d_v = d_u + cost[k]
+            if d_v < dist[v] and not done[v]:
+                dist[v] = d_v
+                pred[v] = u
+                heapq.heappush(heap, (d_v, v))
+    return dist, pred
+
+
+def _route_worker_shard(sources):
+    """Bir kaynak dilimi için öncül satırlarını hesaplar (işçi sürecinde)."""
+    indptr, indices, cost = _ROUTE_WORKER_STATE["csr"]
+    block = np.empty((len(sources), len(indptr) - 1), dtype=np.int32)
+    for row, source in enumerate(sources.tolist()):
+        block[row] = _dijkstra_lists(indptr, indices, cost, source)[1]
+    return sources, block
+
+
+class RouteTable:
+    """
+    Sabit bir ağırlık üçlüsü için tüm kaynaklardan en kısa yol ağaçları.
+
+    `pred[s, v]`, s kökenli ağaçta v'nin öncülüdür (int32, yoksa -1).
+    Herhangi bir (S, D) yolu, yol uzunluğunda O(len) adımda geri kurulur.
+    Tablo kurulduğu graf sürümüne bağlıdır; graf değişirse `stale` olur.
+    """
+
+    def __init__(self, graph, weights, pred):
+        self.graph = graph
+        self.weights = weights
+        self.version = graph.version
+        self.pred = pred
 
-    return link_delay_sum + processing_sum
+    @property
+    def stale(self):
+        return self.graph.version != self.version
 
+    def route(self, source, target):
+        """source -> target yolunu (etiket listesi) döner; yoksa None."""
+        if self.stale:
+            raise ValueError("Yol tablosu güncel değil: graf değişti, tabloyu yeniden kurun.")
 
-def compute_reliability_cost(G, path):
-    if len(path) == 0:
-        return float("inf")
+        Q = self.graph
+        s_idx, t_idx = Q.index(source), Q.index(target)
+        idx_path = _path_from_pred(self.pred[s_idx], s_idx, t_idx)
+        return None if idx_path is None else Q.path_labels(idx_path)
 
-    rel_cost = 0.0
 
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-        link_rel = G.edges[u, v]["link_reliability"]
-        rel_cost += -math.log(link_rel)
+def build_route_table(G, w_delay, w_rel, w_res, workers=None, shards_per_worker=4):
+    """
+    Tüm kaynaklar için öncül tablosunu ProcessPoolExecutor ile paralel kurar.
 
-    for node in path:
-        node_rel = G.nodes[node]["node_reliability"]
-        rel_cost += -math.log(node_rel)
+    - Graf işçilere nx.Graph olarak değil, CSR dizileri ve önceden
+      hesaplanmış yuva maliyetleri olarak (işçi başına bir kez) gönderilir.
+    - Kaynaklar `workers * shards_per_worker` dilime bölünür.
+    - workers=1 ise havuz kurulmaz, her şey bu süreçte hesaplanır.
+    - Dönüş: RouteTable
+    """
+    Q = as_qos_graph(G)
+    n = Q.number_of_nodes()
+    cost = np.array(Q.edge_costs(w_delay, w_rel, w_res))
+    indptr = np.asarray(Q.indptr)
+    indices = np.asarray(Q.indices)
+
+    pred = np.empty((n, n), dtype=np.int32)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or n < 2:
+        # Bu süreçte çalışılırken işçi durumu modül global'inde kalmasın
+        _route_worker_init(indptr, indices, cost)
+        try:
+            _, pred[:] = _route_worker_shard(np.arange(n))
+        finally:
+            _ROUTE_WORKER_STATE.clear()
+    else:
+        shards = np.array_split(np.arange(n), workers * shards_per_worker)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_route_worker_init,
+            initargs=(indptr, indices, cost),
+        ) as pool:
+            for sources, block in pool.map(_route_worker_shard, shards):
+                pred[sources] = block
+
+    return RouteTable(Q, (w_delay, w_rel, w_res), pred)
+
+
+def route_batch(G, pairs, weights, max_bw=1000.0, backend="python"):
+    """
+    Çok sayıda (S, D) çiftini, ortak uçları gruplayarak yönlendirir.
+
+    Çiftler kaynağa göre gruplanır; farklı hedef sayısı daha azsa hedefe
+    göre gruplanır ve ağaç ters yön maliyetleriyle (edge_costs(reverse=True))
+    hedeften kurulur. Her grup için tek bir en kısa yol ağacı, gruptaki tüm
+    uçlar kesinleşene kadar büyütülür; böylece O(çift) arama yerine
+    O(farklı uç) arama yapılır.
+
+    - weights: (w_delay, w_rel, w_res)
+    - backend="scipy": tüm grup kökleri tek bir çok kaynaklı
+      scipy.sparse.csgraph.dijkstra(indices=...) çağrısıyla çözülür
+      (ağaçlar tam kurulur; bellek: grup sayısı x düğüm sayısı).
+    - Dönüş: (paths, metrics)
+        paths  : çiftlerle aynı sırada etiket listeleri (yol yoksa None)
+        metrics: compute_path_metrics_batch sözlüğü; yolu olmayan çiftlerde inf
+    """
+    Q = as_qos_graph(G)
+    pairs = [(Q.index(s), Q.index(d)) for s, d in pairs]
+
+    by_source = {}
+    by_target = {}
+    for i, (s_idx, t_idx) in enumerate(pairs):
+        by_source.setdefault(s_idx, []).append(i)
+        by_target.setdefault(t_idx, []).append(i)
+    reverse = len(by_target) < len(by_source)
+    groups = by_target if reverse else by_source
+
+    if backend == "scipy":
+        _, csgraph_dijkstra = _scipy_csgraph()
+        roots = list(groups)
+        _, preds = csgraph_dijkstra(
+            Q.cost_matrix(*weights, reverse=reverse),
+            directed=True,
+            indices=roots,
+            return_predecessors=True,
+        )
+        trees = zip(roots, preds)
+    elif backend == "python":
+        indptr = Q.indptr.tolist()
+        indices = Q.indices.tolist()
+        cost = Q.edge_costs(*weights, reverse=reverse).tolist()
+
+        def tree(root):
+            # Ters ağaçta kök hedeftir; diğer uç kaynaktır
+            ends = {pairs[i][0] if reverse else pairs[i][1] for i in groups[root]}
+            return _dijkstra_lists(indptr, indices, cost, root, targets=ends)[1]
+
+        trees = ((root, tree(root)) for root in groups)
+    else:
+        raise ValueError(f"Bilinmeyen arka uç: {backend}")
+
+    idx_paths = [None] * len(pairs)
+    for root, pred in trees:
+        members = groups[root]
+        for i in members:
+            s_idx, t_idx = pairs[i]
+            if reverse:
+                path = _path_from_pred(pred, t_idx, s_idx)
+                idx_paths[i] = None if path is None else path[::-1]
+            else:
+                idx_paths[i] = _path_from_pred(pred, s_idx, t_idx)
 
-    return rel_cost
+    paths = [None if p is None else Q.path_labels(p) for p in idx_paths]
+    found = [i for i, p in enumerate(paths) if p is not None]
+    scored = compute_path_metrics_batch(Q, [paths[i] for i in found], weights, max_bw)
 
+    metrics = {}
+    for key, values in scored.items():
+        metrics[key] = np.full(len(paths), np.inf)
+        metrics[key][found] = values
+    return paths, metrics
 
-def compute_resource_cost(G, path, max_bw=1000.0):
-    if len(path) < 2:
-        return float("inf")
 
-    res_cost = 0.0
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-        bw = G.edges[u, v]["bandwidth"]
-        res_cost += max_bw / bw
+# ======================================================
+# 2.3) ALT (A*, Landmark, Üçgen Eşitsizliği) Ön İşleme
+# ======================================================
 
-    return res_cost
+class ALTIndex:
+    """
+    Seçilen k landmark için bileşik maliyet mesafe dizileri.
 
+    - dist_from[i, v] = d(L_i, v), dist_to[i, v] = d(v, L_i)
+      (maliyetler yöne bağlı olduğundan iki ayrı dizi tutulur)
+    - Üçgen eşitsizliğinden d(v, t) >= d(L, t) - d(L, v) ve
+      d(v, t) >= d(v, L) - d(t, L); en büyüğü A* için tutarlı bir alt sınırdır.
+    """
 
-def compute_total_cost(delay, rel_cost, res_cost, w_delay, w_rel, w_res):
-    return w_delay * delay + w_rel * rel_cost + w_res * res_cost
+    def __init__(self, weights, landmarks, dist_from, dist_to):
+        self.weights = weights
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.dist_from = dist_from
+        self.dist_to = dist_to
 
+    def lower_bounds(self, target_idx):
+        """Tüm düğümler için hedefe olan maliyetin alt sınırı."""
+        with np.errstate(invalid="ignore"):
+            fwd = self.dist_from[:, [target_idx]] - self.dist_from
+            bwd = self.dist_to - self.dist_to[:, [target_idx]]
+        bound = np.maximum(fwd, bwd)
+        bound = np.where(np.isfinite(bound), bound, 0.0)
+        return np.maximum(bound.max(axis=0), 0.0)
 
-def find_best_path_simple(G, source, target, w_delay, w_rel, w_res):
-    """Basit: çok amaçlı maliyeti kenar ağırlığına çevirip Dijkstra ile yol bulma."""
-    if source == target:
-        return [source]
 
-    def edge_weight(u, v, data):
-        link_delay = data["link_delay"]
-        proc_delay = G.nodes[v]["processing_delay"]
+def prepare_alt(G, w_delay, w_rel, w_res, n_landmarks=8, seed=None):
+    """
+    ALT ön işlemesi: k landmark seçer ve her birinden ileri/geri tam
+    Dijkstra mesafelerini saklar. Sonuç grafta (version, ağırlıklar)
+    anahtarıyla önbelleğe alınır; find_best_path_simple(algorithm="alt")
+    bunu kullanır, save_network de ağla birlikte dosyaya yazar.
+
+    Landmark'lar "en uzak" kuralıyla seçilir: ilki rastgele, sonraki her
+    landmark seçilmiş olanlara en uzak (ulaşılabilir) düğümdür.
+
+    ALT tek yönlü Dijkstra'ya göre kesinleşen düğüm sayısını belirgin
+    biçimde azaltır, ancak iki yönlü Dijkstra'dan (algorithm=
+    "bidirectional") daha hızlı değildir; ön işleme maliyeti yalnızca
+    tek yönlü aramanın gerektiği yerlerde karşılığını verir.
+    """
+    Q = as_qos_graph(G)
+    n = Q.number_of_nodes()
+    weights = (float(w_delay), float(w_rel), float(w_res))
 
-        node_rel_u = G.nodes[u]["node_reliability"]
-        node_rel_v = G.nodes[v]["node_reliability"]
-        link_rel = data["link_reliability"]
-        edge_rel_cost = -math.log(link_rel) - math.log(node_rel_u) - math.log(node_rel_v)
+    indptr = Q.indptr.tolist()
+    indices = Q.indices.tolist()
+    cost = Q.edge_costs(*weights).tolist()
+    rcost = Q.edge_costs(*weights, reverse=True).tolist()
 
-        bandwidth = data["bandwidth"]
-        res_cost = 1000.0 / bandwidth
+    rng = np.random.default_rng(seed)
+    k = min(n_landmarks, n)
+    landmarks = []
+    dist_from = np.empty((k, n))
+    dist_to = np.empty((k, n))
+    nearest = np.full(n, np.inf)
 
-        total_delay_edge = link_delay + proc_delay
+    current = int(rng.integers(n)) if n else 0
+    for i in range(k):
+        landmarks.append(current)
+        dist_from[i] = _dijkstra_lists(indptr, indices, cost, current)[0]
+        dist_to[i] = _dijkstra_lists(indptr, indices, rcost, current)[0]
 
-        return compute_total_cost(
-            total_delay_edge,
-            edge_rel_cost,
-            res_cost,
-            w_delay,
-            w_rel,
-            w_res,
-        )
+        nearest = np.minimum(nearest, dist_from[i])
+        candidates = np.where(np.isfinite(nearest), nearest, -1.0)
+        candidates[landmarks] = -1.0
+        current = int(np.argmax(candidates))
 
-    try:
-        path = nx.dijkstra_path(
-            G,
-            source=source,
-            target=target,
-            weight=lambda u, v, d: edge_weight(u, v, d),
-        )
-        return path
-    except nx.NetworkXNoPath:
-        return None
+    index = ALTIndex(weights, landmarks, dist_from, dist_to)
+    _store_alt(Q, index)
+    return index
 
 
-def q_learning_shortest_path(
-    G,
-    source,
-    target,
-    w_delay,
-    w_rel,
-    w_res,
-    episodes: int = 200,
-    max_steps: int = 200,
-    alpha: float = 0.6,
-    gamma: float = 0.9,
-    epsilon_start: float = 1.0,
-    epsilon_end: float = 0.05,
-):
-    """
-    Basit Q-Learning tabanlı yol bulma.
+def _store_alt(Q, index):
+    Q._alt_cache.put((Q.version,) + index.weights, index)
 
-    - Durumlar: Düğümler
-    - Aksiyonlar: Komşu düğümler
-    - Ödül: Seçilen kenarın ağırlığına dayalı negatif maliyet
-            (toplam maliyeti minimize etmek için)
 
-    Not: Bu, eğitim amaçlı basit bir sürümdür; büyük ağlarda /
-    çok sayıda bölümde çalıştırmak maliyetli olabilir.
-    """
+def _cached_alt(Q, w_delay, w_rel, w_res):
+    return Q._alt_cache.get((Q.version, float(w_delay), float(w_rel), float(w_res)))
 
-    if source == target:
-        return [source]
 
-    # Q-tablosu: (state, action) -> Q değeri
-    Q = {}
+# ======================================================
+# 2.4) Yol Önbelleği (LRU)
+# ======================================================
 
-    def edge_cost(u, v):
-        data = G.edges[u, v]
-        link_delay = data["link_delay"]
-        proc_delay = G.nodes[v]["processing_delay"]
+class RouteCache:
+    """
+    Tek bir grafa bağlı, boyut ve bellek sınırlı LRU yol önbelleği.
+
+    Anahtar: (graf sürümü, S, D, yuvarlanmış ağırlıklar, algoritma, parametreler).
+    - Yol metrikleri yön bağımsız olduğundan (S, D) için saklanan yol,
+      ters çevrilerek (D, S) sorgusuna da döndürülür (symmetric=True).
+    - Graf değiştiğinde (subscribe) eski sürüme ait tüm girdiler silinir;
+      sürüm anahtarda olduğu için eski bir girdi zaten hiç eşleşmez.
+    - "Yol yok" (None) sonucu da saklanabilir.
+    """
 
-        node_rel_u = G.nodes[u]["node_reliability"]
-        node_rel_v = G.nodes[v]["node_reliability"]
-        link_rel = data["link_reliability"]
-        edge_rel_cost = -math.log(link_rel) - math.log(node_rel_u) - math.log(node_rel_v)
+    def __init__(
+        self, G, max_entries=1024, max_bytes=1 << 20, weight_digits=6, symmetric=True
+    ):
+        self.graph = as_qos_graph(G)
+        self.weight_digits = weight_digits
+        self.symmetric = symmetric
+
+        self._entries = _LRUCache(max_entries, max_bytes, self._entry_bytes)
+        self.graph.subscribe(self._on_graph_change)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, source, target, weights, algorithm, params):
+        weights = tuple(round(float(w), self.weight_digits) for w in weights)
+        return (
+            self.graph.version,
+            source,
+            target,
+            weights,
+            algorithm,
+            tuple(sorted(params.items())),
+        )
 
-        bandwidth = data["bandwidth"]
-        res_cost = 1000.0 / bandwidth
+    @staticmethod
+    def _entry_bytes(key, path):
+        size = sys.getsizeof(key)
+        if path is not None:
+            size += sys.getsizeof(path) + sum(sys.getsizeof(n) for n in path)
+        return size
 
-        total_delay_edge = link_delay + proc_delay
+    def lookup(self, source, target, weights, algorithm="dijkstra", **params):
+        """
+        (bulundu, yol) döner. Önce (S, D), symmetric ise ardından (D, S)
+        girdisine bakılır; ikincisinde yol ters çevrilerek döner.
+        """
+        key = self._key(source, target, weights, algorithm, params)
+        if self.symmetric and key not in self._entries:
+            rkey = self._key(target, source, weights, algorithm, params)
+            if rkey in self._entries:
+                path = self._entries.get(rkey)
+                return True, None if path is None else path[::-1]
+
+        path = self._entries.get(key, _MISSING)
+        if path is _MISSING:
+            return False, None
+        return True, None if path is None else list(path)
+
+    def store(self, source, target, weights, path, algorithm="dijkstra", **params):
+        key = self._key(source, target, weights, algorithm, params)
+        self._entries.put(key, None if path is None else list(path))
+
+    def get_or_compute(self, source, target, weights, compute, algorithm="dijkstra", **params):
+        """Önbellekte yoksa `compute()` çağrılır ve sonucu saklanır."""
+        found, path = self.lookup(source, target, weights, algorithm, **params)
+        if not found:
+            path = compute()
+            self.store(source, target, weights, path, algorithm, **params)
+        return path
 
-        return compute_total_cost(
-            total_delay_edge,
-            edge_rel_cost,
-            res_cost,
-            w_delay,
-            w_rel,
-            w_res,
-        )
+    def clear(self):
+        self._entries.clear()
 
-    nodes = list(G.nodes())
+    def stats(self):
+        """İsabet / ıska / çıkarma sayaçları ve güncel doluluk."""
+        return self._entries.stats("entries")
 
-    def get_Q(s, a):
-        return Q.get((s, a), 0.0)
+    def _on_graph_change(self, graph, change):
+        self._entries.retain(lambda key: key[0] == graph.version)
 
-    def set_Q(s, a, value):
-        Q[(s, a)] = value
 
-    def epsilon_greedy(state, epsilon):
-        neighbors = list(G.neighbors(state))
-        if not neighbors:
-            return None
+# ======================================================
+# 2.5) k En İyi Yol (tembel Yen)
+# ======================================================
 
-        # Rastgele seçim (keşif)
-        if random.random() < epsilon:
-            return random.choice(neighbors)
-
-        # En iyi aksiyonu seç (sömürü)
-        best_a = None
-        best_q = None
-        for a in neighbors:
-            q_val = get_Q(state, a)
-            if best_q is None or q_val > best_q:
-                best_q = q_val
-                best_a = a
-        return best_a
-
-    def max_Q(state):
-        neighbors = list(G.neighbors(state))
-        if not neighbors:
-            return 0.0
-        return max(get_Q(state, a) for a in neighbors)
+def _spur_astar(indptr, indices, cost, h, source, target, blocked_nodes, blocked_next):
+    """
+    Yen sapma araması: `blocked_nodes` hiç, `source`tan `blocked_next`
+    düğümlerine giden kenarlar ise kullanılmadan A*. `h` hedefe kalan
+    tam mesafedir (engelsiz ağda); engeller mesafeyi yalnızca artırdığı
+    için tutarlı bir alt sınırdır. Dönüş: indeks yolu veya None.
+    """
+    inf = float("inf")
+    g = {source: 0.0}
+    pred = {source: -1}
+    done = set()
+    heap = [(h[source], source)]
+    while heap:
+        _, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        if u == target:
+            path = [u]
+            while pred[u] >= 0:
+                u = pred[u]
+                path.append(u)
+            return path[::-1]
+
+        g_u = g[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if v in blocked_nodes or v in done or h[v] == inf:
+                continue
+            if u == source and v in blocked_next:
+                continue
+            g_v = g_u + cost[k]
+            if g_v < g.get(v, inf):
+                g[v] = g_v
+                pred[v] = u
+                heapq.heappush(heap, (g_v + h[v], v))
+    return None
+
+
+def k_best_paths(G, source, target, weights, k=None):
+    """
+    source -> target arasındaki döngüsüz yolları bileşik maliyete göre
+    artan sırada üreten tembel Yen üreteci (en fazla k yol; k=None ise
+    tükenene kadar). Kenar maliyeti find_best_path_simple ile aynıdır.
+
+    - Hedefe tek bir ters en kısa yol ağacı kurulur. Ağaçtaki mesafeler
+      sapma aramalarında A* alt sınırı olarak kullanılır. Ayrıca sapma
+      düğümünün ağaç yolu engellere değmiyorsa arama hiç yapılmaz, ağaç
+      yolu doğrudan alınır.
+    - Bir sonraki yolun adayları yalnızca o yol istendiğinde üretilir;
+      tüketilmeyen yollar için iş yapılmaz.
+    """
+    Q = as_qos_graph(G)
+    s_idx, t_idx = Q.index(source), Q.index(target)
+    if k is not None and k <= 0:
+        return
+
+    slot_cost = Q.edge_costs(*weights)
+    indptr = Q.indptr.tolist()
+    indices = Q.indices.tolist()
+    cost = slot_cost.tolist()
+    h, tree = _dijkstra_lists(
+        indptr, indices, Q.edge_costs(*weights, reverse=True).tolist(), t_idx
+    )
+    if h[s_idx] == float("inf"):
+        return
+
+    def tree_path(node):
+        path = [node]
+        while node != t_idx:
+            node = tree[node]
+            path.append(node)
+        return path
 
-    # Lineer epsilon azalması
-    def epsilon_for_episode(ep):
-        if episodes <= 1:
-            return epsilon_end
-        t = ep / (episodes - 1)
-        return epsilon_start * (1 - t) + epsilon_end * t
+    def prefix_costs(path):
+        if len(path) < 2:
+            return [0.0]
+        steps = slot_cost[Q.slots(path[:-1], path[1:])]
+        return [0.0] + np.cumsum(steps).tolist()
+
+    first = tree_path(s_idx)
+    found = [(first, prefix_costs(first))]
+    candidates = []
+    seen = {tuple(first)}
+
+    while True:
+        path, _ = found[-1]
+        yield Q.path_labels(path)
+        if k is not None and len(found) >= k:
+            return
 
-    best_path = None
-    best_total_reward = None
+        # Son bulunan yolun her düğümünden sapma adayları
+        for i in range(len(path) - 1):
+            spur = path[i]
+            root = path[: i + 1]
+            blocked_next = {p[i + 1] for p, _ in found if p[: i + 1] == root}
+            blocked_nodes = set(root[:-1])
+
+            spur_path = tree_path(spur)
+            if spur_path[1] in blocked_next or not blocked_nodes.isdisjoint(spur_path):
+                spur_path = _spur_astar(
+                    indptr, indices, cost, h, spur, t_idx, blocked_nodes, blocked_next
+                )
+                if spur_path is None:
+                    continue
+
+            candidate = root[:-1] + spur_path
+            key = tuple(candidate)
+            if key in seen:
+                continue
+            seen.add(key)
+            prefix = prefix_costs(candidate)
+            heapq.heappush(candidates, (prefix[-1], key, prefix))
+
+        if not candidates:
+            return
+        _, key, prefix = heapq.heappop(candidates)
+        found.append((list(key), prefix))
 
-    for ep in range(episodes):
-        state = source
-        visited = {state}
-        path = [state]
-        total_reward = 0.0
-        epsilon = epsilon_for_episode(ep)
 
-        for _ in range(max_steps):
-            if state == target:
-                break
+# ======================================================
+# 2.6) Pareto Cephesi (çok etiketli arama)
+# ======================================================
 
-            action = epsilon_greedy(state, epsilon)
-            if action is None:
-                break
+def _dominates(a, b, eps):
+    """a, b'yi (1 + eps) toleransla zayıf baskılıyor mu (3 ölçüt)."""
+    f = 1.0 + eps
+    return a[0] <= b[0] * f and a[1] <= b[1] * f and a[2] <= b[2] * f
 
-            # Aynı düğüm etrafında dönmeyi azaltmak için
-            # zaten ziyaret edilmiş bir düğüme tekrar gitmeyi
-            # biraz cezalandırıyoruz.
-            step_cost = edge_cost(state, action)
-            reward = -step_cost
-            if action in visited:
-                reward -= 0.1 * abs(reward)
 
-            next_state = action
+class ParetoFront:
+    """
+    Bir (S, D) çifti için baskılanmayan yollar ve ölçütleri.
 
-            old_q = get_Q(state, action)
-            target_q = reward + gamma * max_Q(next_state)
-            new_q = (1 - alpha) * old_q + alpha * target_q
-            set_Q(state, action, new_q)
+    metrics[i] = (total_delay, rel_cost, res_cost); değerler
+    compute_path_metrics_batch ile birebir aynıdır. Herhangi bir ağırlık
+    üçlüsü için en iyi yol, yeni arama yapılmadan cephe taranarak bulunur.
+    """
 
-            total_reward += reward
-            state = next_state
-            path.append(state)
-            visited.add(state)
+    def __init__(self, graph, source, target, paths, metrics, eps):
+        self.graph = graph
+        self.source = source
+        self.target = target
+        self.paths = paths
+        self.metrics = metrics
+        self.eps = eps
+        self.version = graph.version
 
-            if state == target:
-                break
+    def __len__(self):
+        return len(self.paths)
 
-        if state == target:
-            if best_total_reward is None or total_reward > best_total_reward:
-                best_total_reward = total_reward
-                best_path = path
+    def costs(self, w_delay, w_rel, w_res):
+        """Cephedeki her yolun bileşik maliyeti."""
+        return compute_total_cost(
+            self.metrics[:, 0], self.metrics[:, 1], self.metrics[:, 2],
+            w_delay, w_rel, w_res,
+        )
 
-    return best_path
+    def best(self, w_delay, w_rel, w_res, return_info=False):
+        """
+        Verilen ağırlıklarla toplam maliyeti en küçük cephe yolu (O(cephe)).
+        Cephe boşsa None döner. return_info=True ise (yol, bilgi) döner;
+        bilgi: "cost", "total_delay", "rel_cost", "res_cost".
+        """
+        if not self.paths:
+            return (None, {"cost": np.inf}) if return_info else None
+        costs = self.costs(w_delay, w_rel, w_res)
+        i = int(np.argmin(costs))
+        path = list(self.paths[i])
+        if return_info:
+            delay, rel, res = self.metrics[i].tolist()
+            info = {
+                "cost": float(costs[i]),
+                "total_delay": delay,
+                "rel_cost": rel,
+                "res_cost": res,
+            }
+            return path, info
+        return path
 
 
-def sarsa_shortest_path(
-    G,
-    source,
-    target,
-    w_delay,
-    w_rel,
-    w_res,
-    episodes: int = 200,
-    max_steps: int = 200,
-    alpha: float = 0.6,
-    gamma: float = 0.9,
-    epsilon_start: float = 1.0,
-    epsilon_end: float = 0.05,
-):
+def pareto_front(G, source, target, eps=0.0, max_bw=1000.0):
     """
-    SARSA (on-policy) tabanlı basit yol bulma.
-
-    Q-Learning'e benzer, fakat güncellemede bir sonraki
-    durumdaki *seçilen* aksiyonun Q değeri kullanılır.
+    (gecikme, güvenilirlik maliyeti, kaynak maliyeti) üzerinde etiket
+    yerleştirmeli çok amaçlı en kısa yol araması; ParetoFront döner.
+
+    Yuva k = (u -> v) ölçütleri: link_delay + proc(v),
+    link_rel_cost + node_rel_cost(v), max_bw / bandwidth. Yol toplamı bu
+    ölçütlerden proc(D) çıkarılıp node_rel_cost(S) eklenerek elde edilir
+    (sabit kaydırma, baskılama ilişkisini değiştirmez).
+
+    - Etiketler sözlük sırasıyla kesinleşir; bir düğümde kesinleşmiş bir
+      etiketin baskıladığı yeni etiketler atılır.
+    - Her ölçüt için hedefe ters Dijkstra alt sınırları hesaplanır;
+      etiket + alt sınır, hedefteki bir etiket tarafından baskılanıyorsa
+      budanır.
+    - eps > 0 ise (1 + eps)-baskılama kullanılır: cephe küçülür, her
+      atılan yol için maliyeti en fazla yaklaşık (1 + eps) kat olan bir
+      temsilci kalır. eps=0 tam cephedir.
     """
+    Q = as_qos_graph(G)
+    s_idx, t_idx = Q.index(source), Q.index(target)
+    if s_idx == t_idx:
+        paths = [[source]]
+        m = compute_path_metrics_batch(Q, paths, (1.0, 1.0, 1.0), max_bw)
+        metrics = np.column_stack([m["total_delay"], m["rel_cost"], m["res_cost"]])
+        return ParetoFront(Q, source, target, paths, metrics, eps)
+
+    e = Q.slot_edge
+    v = Q.indices
+    usable = np.isfinite(Q.edge_costs(1.0, 1.0, 1.0))
+    criteria = [
+        np.where(usable, Q.link_delay[e] + Q.processing_delay[v], np.inf),
+        np.where(usable, Q.link_rel_cost[e] + Q.node_rel_cost[v], np.inf),
+        np.where(usable, max_bw / Q.bandwidth[e], np.inf),
+    ]
+
+    indptr = Q.indptr.tolist()
+    indices = v.tolist()
+    bounds = [
+        _dijkstra_lists(indptr, indices, c[Q.slot_reverse].tolist(), t_idx)[0]
+        for c in criteria
+    ]
+    lb = list(zip(*bounds))
+    slot_vals = list(zip(*(c.tolist() for c in criteria)))
+
+    inf = float("inf")
+    # Etiket: (değerler, düğüm, üst etiket numarası)
+    labels = [((0.0, 0.0, 0.0), s_idx, -1)]
+    settled = [[] for _ in range(Q.number_of_nodes())]
+    heap = [((0.0, 0.0, 0.0), 0)]
+    front = []
+
+    while heap:
+        vals, label_id = heapq.heappop(heap)
+        node = labels[label_id][1]
+        if any(_dominates(other, vals, eps) for other in settled[node]):
+            continue
+        settled[node].append(vals)
+        if node == t_idx:
+            front.append(label_id)
+            continue
 
-    if source == target:
-        return [source]
+        d0, d1, d2 = vals
+        for k in range(indptr[node], indptr[node + 1]):
+            w = indices[k]
+            c0, c1, c2 = slot_vals[k]
+            if c0 == inf:
+                continue
+            lw = lb[w]
+            if lw[0] == inf:
+                continue
+            new = (d0 + c0, d1 + c1, d2 + c2)
+            if any(_dominates(other, new, eps) for other in settled[w]):
+                continue
+            bound = (new[0] + lw[0], new[1] + lw[1], new[2] + lw[2])
+            if any(_dominates(other, bound, eps) for other in settled[t_idx]):
+                continue
+            labels.append((new, w, label_id))
+            heapq.heappush(heap, (new, len(labels) - 1))
+
+    idx_paths = []
+    for label_id in front:
+        path = []
+        while label_id >= 0:
+            _, node, label_id = labels[label_id]
+            path.append(node)
+        idx_paths.append(path[::-1])
+
+    paths = [Q.path_labels(p) for p in idx_paths]
+    if paths:
+        m = compute_path_metrics_batch(Q, paths, (1.0, 1.0, 1.0), max_bw)
+        metrics = np.column_stack([m["total_delay"], m["rel_cost"], m["res_cost"]])
+    else:
+        metrics = np.empty((0, 3))
+    return ParetoFront(Q, source, target, paths, metrics, eps)
 
-    Q = {}
 
-    def edge_cost(u, v):
-        data = G.edges[u, v]
-        link_delay = data["link_delay"]
-        proc_delay = G.nodes[v]["processing_delay"]
+# ======================================================
+# 2.7) Ağırlık Simpleksi Yol Atlası
+# ======================================================
 
-        node_rel_u = G.nodes[u]["node_reliability"]
-        node_rel_v = G.nodes[v]["node_reliability"]
-        link_rel = data["link_reliability"]
-        edge_rel_cost = -math.log(link_rel) - math.log(node_rel_u) - math.log(node_rel_v)
+class RouteAtlas:
+    """
+    Bir (S, D) çifti için ağırlık simpleksinin üçgen ızgarasında en iyi
+    yollar. Izgara noktası (i, j, k), i + j + k = resolution, ağırlıkları
+    (i, j, k) / resolution'dır. Aynı yolu veren hücreler tek bir yol
+    kaydını paylaşır (`paths`); `cell_path[i, j]` bu kaydın numarasıdır.
+    """
 
-        bandwidth = data["bandwidth"]
-        res_cost = 1000.0 / bandwidth
+    def __init__(self, graph, source, target, resolution, paths, cell_path, version=None):
+        self.graph = graph
+        self.source = source
+        self.target = target
+        self.resolution = resolution
+        self.paths = paths
+        self.cell_path = cell_path
+        self.version = graph.version if version is None else version
 
-        total_delay_edge = link_delay + proc_delay
+    @property
+    def stale(self):
+        return self.graph.version != self.version
 
-        return compute_total_cost(
-            total_delay_edge,
-            edge_rel_cost,
-            res_cost,
-            w_delay,
-            w_rel,
-            w_res,
+    def cell(self, w_delay, w_rel, w_res):
+        """
+        Ağırlıklara en yakın ızgara noktası (i, j) - O(1). Ağırlıklar
+        normalize edilir; toplamı sıfırsa None döner.
+        """
+        total = w_delay + w_rel + w_res
+        if total <= 0:
+            return None
+        r = self.resolution
+        x = [w_delay * r / total, w_rel * r / total, w_res * r / total]
+        base = [math.floor(v) for v in x]
+        # Kalan birimler kesir kısmı en büyük koordinatlara dağıtılır
+        order = sorted(range(3), key=lambda c: base[c] - x[c])
+        for c in order[: r - sum(base)]:
+            base[c] += 1
+        return base[0], base[1]
+
+    def lookup(self, w_delay, w_rel, w_res):
+        """Ağırlıklara en yakın hücrenin yolu (etiket listesi) veya None."""
+        cell = self.cell(w_delay, w_rel, w_res)
+        if cell is None:
+            return None
+        path_id = self.cell_path[cell]
+        return None if path_id < 0 else list(self.paths[path_id])
+
+
+def build_route_atlas(
+    G, source, target, resolution=24, coarse=4, algorithm="dijkstra", cancel=None
+):
+    """
+    Ağırlık simpleksinin üçgen ızgarasında find_best_path_simple ile
+    RouteAtlas kurar.
+
+    Bir yolun maliyeti ağırlıklarda doğrusaldır; bir yol bir üçgenin üç
+    köşesinde de en iyiyse üçgenin içinde de en iyidir. Bu yüzden önce
+    `coarse` adımlı kaba ızgara hesaplanır; köşeleri aynı yolu veren kaba
+    üçgenlerin içindeki noktalar aramasız doldurulur, yalnızca sınırdaki
+    üçgenlerde arama yapılır.
+
+    `cancel` (threading.Event) ayarlanırsa kurulum yarıda bırakılır ve
+    None döner; arka planda çalışan GUI işçisi içindir.
+
+    Izgara noktalarının maliyetleri grafın paylaşılan LRU önbellekleri
+    yerine doğrudan (composite_edge_costs) hesaplanır: kurulum başka bir
+    iş parçacığında çalışırken önbelleklere dokunmaz ve yüzlerce ağırlık
+    üçlüsüyle ana iş parçacığının girdilerini de taşırmaz. Bu yüzden
+    algorithm yalnızca "dijkstra" ya da "bidirectional" olabilir. Kurulum
+    sırasında graf değişirse atlas `stale` olur. nx.Graph verilirse
+    dönüşüm (as_qos_graph) çağıran iş parçacığında yapılmalıdır; GUI
+    QoSGraph geçirir.
+    """
+    if resolution % coarse:
+        raise ValueError(
+            f"resolution ({resolution}) coarse ({coarse}) adımının katı olmalı."
         )
+    if algorithm not in ("dijkstra", "bidirectional"):
+        raise ValueError(f"Atlas için desteklenmeyen algoritma: {algorithm}")
+    Q = as_qos_graph(G)
+    version = Q.version
+    try:
+        s_idx, t_idx = Q.index(source), Q.index(target)
+    except KeyError as exc:
+        raise nx.NodeNotFound(f"Düğüm ağda bulunamadı: {exc}") from None
+    r = resolution
+    cell_path = np.full((r + 1, r + 1), -1, dtype=np.int32)
+    paths = []
+    path_ids = {}
+
+    def solve(i, j):
+        if cancel is not None and cancel.is_set():
+            return False
+        cost = Q.composite_edge_costs(i / r, j / r, (r - i - j) / r)
+        if algorithm == "dijkstra":
+            _, pred, _ = _dijkstra_csr(Q.indptr, Q.indices, cost, s_idx, t_idx)
+            idx_path = _path_from_pred(pred, s_idx, t_idx)
+        else:
+            idx_path = _bidirectional_dijkstra_csr(
+                Q.indptr, Q.indices, cost, cost[Q.slot_reverse], s_idx, t_idx
+            )[0]
+        key = None if idx_path is None else tuple(Q.path_labels(idx_path))
+        if key is None:
+            cell_path[i, j] = -1
+            return True
+        if key not in path_ids:
+            path_ids[key] = len(paths)
+            paths.append(key)
+        cell_path[i, j] = path_ids[key]
+        return True
+
+    computed = np.zeros((r + 1, r + 1), dtype=bool)
+    for i in range(0, r + 1, coarse):
+        for j in range(0, r + 1 - i, coarse):
+            if not solve(i, j):
+                return None
+            computed[i, j] = True
+
+    for i in range(r + 1):
+        for j in range(r + 1 - i):
+            if computed[i, j]:
+                continue
+            a, b = i // coarse, j // coarse
+            ri, rj = i % coarse, j % coarse
+            if ri + rj <= coarse:
+                corners = ((a, b), (a + 1, b), (a, b + 1))
+            else:
+                corners = ((a + 1, b), (a, b + 1), (a + 1, b + 1))
+            ids = {int(cell_path[ca * coarse, cb * coarse]) for ca, cb in corners}
+            if len(ids) == 1 and -1 not in ids:
+                cell_path[i, j] = ids.pop()
+            elif not solve(i, j):
+                return None
 
-    def get_Q(s, a):
-        return Q.get((s, a), 0.0)
+    cell_path.setflags(write=False)
+    return RouteAtlas(
+        Q, source, target, resolution, [list(p) for p in paths], cell_path, version
+    )
 
-    def set_Q(s, a, value):
-        Q[(s, a)] = value
 
-    def epsilon_greedy(state, epsilon):
-        neighbors = list(G.neighbors(state))
-        if not neighbors:
+# ======================================================
+# 2.8) Gecikme Kısıtlı En Ucuz Yol (LARAC)
+# ======================================================
+
+def find_delay_constrained_path(
+    G, source, target, max_delay, objective="res", max_iter=30, return_info=False
+):
+    """
+    compute_total_delay(yol) <= max_delay koşuluyla kaynak ("res") ya da
+    güvenilirlik ("rel") maliyetini en küçükleyen yol; LARAC (Lagrange
+    gevşetmesi) ile çözülür.
+
+    Her adım c + lambda * d ağırlıklı bir Dijkstra'dır; lambda, biri uygun
+    biri uygunsuz iki yolun kesişiminden güncellenir. Genelde birkaç
+    Dijkstra'da biter. Yol uygun (gecikme sınırı içinde) olmayı garanti
+    eder; optimumdan uzaklığı Lagrange alt sınırıyla raporlanır.
+
+    - Uygun yol yoksa None döner.
+    - return_info=True ise (yol, bilgi) döner. bilgi: "cost" (amaç
+      değeri), "delay", "lower_bound", "gap" (cost - lower_bound),
+      "lambda", "dijkstra_runs".
+    """
+    Q = as_qos_graph(G)
+    try:
+        s_idx, t_idx = Q.index(source), Q.index(target)
+    except KeyError as exc:
+        raise nx.NodeNotFound(f"Düğüm ağda bulunamadı: {exc}") from None
+
+    e = Q.slot_edge
+    v = Q.indices
+    usable = np.isfinite(Q.edge_costs(1.0, 1.0, 1.0))
+    if objective == "res":
+        cost = 1000.0 / Q.bandwidth[e]
+        offset = 0.0
+    elif objective == "rel":
+        cost = Q.link_rel_cost[e] + Q.node_rel_cost[v]
+        offset = float(Q.node_rel_cost[s_idx])
+    else:
+        raise ValueError(f"Bilinmeyen amaç: {objective}")
+    cost = np.where(usable, cost, np.inf)
+    # Yuva gecikmesi uç düğümün işlem gecikmesini içerir; hedefinki
+    # yol gecikmesine sayılmadığından sınır o kadar kaydırılır.
+    delay = np.where(usable, Q.link_delay[e] + Q.processing_delay[v], np.inf)
+    bound = max_delay + float(Q.processing_delay[t_idx])
+
+    runs = 0
+
+    def shortest(slot_weight):
+        nonlocal runs
+        runs += 1
+        _, pred, _ = _dijkstra_csr(Q.indptr, Q.indices, slot_weight, s_idx, t_idx)
+        idx_path = _path_from_pred(pred, s_idx, t_idx)
+        if idx_path is None:
             return None
+        slots = Q.slots(idx_path[:-1], idx_path[1:])
+        return idx_path, float(cost[slots].sum()), float(delay[slots].sum())
 
-        if random.random() < epsilon:
-            return random.choice(neighbors)
-
-        best_a = None
-        best_q = None
-        for a in neighbors:
-            q_val = get_Q(state, a)
-            if best_q is None or q_val > best_q:
-                best_q = q_val
-                best_a = a
-        return best_a
-
-    def epsilon_for_episode(ep):
-        if episodes <= 1:
-            return epsilon_end
-        t = ep / (episodes - 1)
-        return epsilon_start * (1 - t) + epsilon_end * t
+    def result(found, lower_bound, lam):
+        if found is None:
+            path, info = None, {"cost": np.inf, "delay": np.inf}
+        else:
+            path = Q.path_labels(found[0])
+            info = {"cost": found[1] + offset, "delay": compute_total_delay(Q, path)}
+        info.update(
+            lower_bound=lower_bound + offset,
+            gap=np.inf if found is None else info["cost"] - (lower_bound + offset),
+            dijkstra_runs=runs,
+        )
+        info["lambda"] = lam
+        return (path, info) if return_info else path
+
+    if s_idx == t_idx:
+        return result(([s_idx], 0.0, 0.0), 0.0, 0.0)
+
+    cheap = shortest(cost)
+    if cheap is None:
+        return result(None, np.inf, 0.0)
+    if cheap[2] <= bound:
+        return result(cheap, cheap[1], 0.0)
+
+    fast = shortest(delay)
+    if fast[2] > bound:
+        return result(None, np.inf, np.inf)
+
+    # cheap: ucuz ama uygunsuz, fast: uygun; lambda ikisini eşitler
+    lower_bound = cheap[1]
+    lam = 0.0
+    for _ in range(max_iter):
+        lam = (cheap[1] - fast[1]) / (fast[2] - cheap[2])
+        found = shortest(cost + lam * delay)
+        found_value = found[1] + lam * found[2]
+        lower_bound = max(lower_bound, found_value - lam * bound)
+
+        cheap_value = cheap[1] + lam * cheap[2]
+        if found_value >= cheap_value - 1e-12 * max(1.0, abs(cheap_value)):
+            break
+        if found[2] <= bound:
+            fast = found
+        else:
+            cheap = found
 
-    best_path = None
-    best_total_reward = None
+    return result(fast, min(lower_bound, fast[1]), lam)
 
-    for ep in range(episodes):
-        state = source
-        epsilon = epsilon_for_episode(ep)
-        action = epsilon_greedy(state, epsilon)
-        if action is None:
-            continue
 
-        visited = {state}
-        path = [state]
-        total_reward = 0.0
+# ======================================================
+# 2.9) Hedef Anahtarlı Q-Tablosu Deposu
+# ======================================================
 
-        for _ in range(max_steps):
-            if action is None:
-                break
+class QTableStore:
+    """
+    Tek bir grafa bağlı, bellek sınırlı LRU Q-tablosu deposu.
 
-            # Çevrimleri azaltmak için tekrar ziyaret cezası
-            step_cost = edge_cost(state, action)
-            reward = -step_cost
-            if action in visited:
-                reward -= 0.1 * abs(reward)
+    Anahtar: (graf sürümü, hedef, yuvarlanmış ağırlıklar, algoritma, talep).
+    Q değerleri hedefe kalan maliyeti öğrendiğinden, aynı hedefe başka bir
+    kaynaktan gelen sorgu saklanan tablodan sıcak başlayabilir. Her girdi
+    yuva başına (float64 Q, bool denendi) dizi çiftidir; graf değiştiğinde
+    (subscribe) eski sürümün tabloları silinir.
+    """
 
-            next_state = action
+    def __init__(self, G, max_tables=32, max_bytes=64 << 20, weight_digits=6):
+        self.graph = as_qos_graph(G)
+        self.weight_digits = weight_digits
 
-            if next_state == target:
-                next_action = None
-            else:
-                next_action = epsilon_greedy(next_state, epsilon)
+        self._tables = _LRUCache(max_tables, max_bytes, self._entry_bytes)
+        self.graph.subscribe(self._on_graph_change)
 
-            old_q = get_Q(state, action)
-            if next_action is None:
-                target_q = reward
-            else:
-                target_q = reward + gamma * get_Q(next_state, next_action)
+    def __len__(self):
+        return len(self._tables)
 
-            new_q = (1 - alpha) * old_q + alpha * target_q
-            set_Q(state, action, new_q)
+    def key(self, G, target, weights, algorithm, demand_mbps=None):
+        if as_qos_graph(G) is not self.graph:
+            raise ValueError("Q-tablosu deposu başka bir grafa bağlı.")
+        weights = tuple(round(float(w), self.weight_digits) for w in weights)
+        return (self.graph.version, target, weights, algorithm, demand_mbps)
 
-            total_reward += reward
-            state = next_state
-            path.append(state)
-            visited.add(state)
-            action = next_action
+    @staticmethod
+    def _entry_bytes(key, entry):
+        return entry[0].nbytes + entry[1].nbytes
 
-            if state == target:
-                break
+    def get(self, key):
+        """
+        Saklanan (q, tried) çiftini döner (yoksa None); çağıran
+        kopyalamalıdır.
+        """
+        return self._tables.get(key)
 
-        if state == target:
-            if best_total_reward is None or total_reward > best_total_reward:
-                best_total_reward = total_reward
-                best_path = path
+    def put(self, key, q, tried):
+        self._tables.put(key, (q, tried))
 
-    return best_path
+    def clear(self):
+        self._tables.clear()
+
+    def stats(self):
+        """İsabet / ıska / çıkarma sayaçları ve güncel doluluk."""
+        return self._tables.stats("tables")
+
+    def _on_graph_change(self, graph, change):
+        self._tables.retain(lambda key: key[0] == graph.version)
 
 
 # ======================================================
@@ -451,6 +3324,11 @@ class QoSRoutingApp(tk.Tk):
 
         self.G = None
         self.pos = None
+        self.route_cache = None
+        self.q_store = None
+        self.atlas = None
+        self._atlas_cancel = None
+        self.last_train_info = None
 
         self._build_layout()
 
@@ -476,6 +3354,7 @@ class QoSRoutingApp(tk.Tk):
 
         s.configure("TLabel", background=self.light_card, font=("Segoe UI", 9))
         s.configure("Small.TLabel", background=self.light_card, font=("Segoe UI", 8))
+        s.configure("TCheckbutton", background=self.light_card, font=("Segoe UI", 8))
 
         s.configure(
             "Accent.TButton",
@@ -537,6 +3416,7 @@ class QoSRoutingApp(tk.Tk):
         self.style.configure("Card.TLabelframe.Label", background=card, foreground=fg_text)
         self.style.configure("TLabel", background=card, foreground=fg_text)
         self.style.configure("Small.TLabel", background=card, foreground=fg_text)
+        self.style.configure("TCheckbutton", background=card, foreground=fg_text)
 
         self.style.configure(
             "Modern.Horizontal.TScale",
@@ -618,6 +3498,25 @@ class QoSRoutingApp(tk.Tk):
         )
         self.btn_generate.pack(fill=tk.X, pady=3)
 
+        file_frame = ttk.Frame(network_frame, style="Card.TLabelframe")
+        file_frame.pack(fill=tk.X, pady=(0, 3))
+
+        self.btn_save = ttk.Button(
+            file_frame,
+            text="Ağı Kaydet",
+            style="Ghost.TButton",
+            command=self.on_save_network,
+        )
+        self.btn_save.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 2))
+
+        self.btn_load = ttk.Button(
+            file_frame,
+            text="Ağı Yükle",
+            style="Ghost.TButton",
+            command=self.on_load_network,
+        )
+        self.btn_load.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(2, 0))
+
         sd_frame = ttk.Frame(network_frame, style="Card.TLabelframe")
         sd_frame.pack(fill=tk.X, pady=5)
 
@@ -627,6 +3526,7 @@ class QoSRoutingApp(tk.Tk):
             sd_frame, textvariable=self.source_var, state="readonly"
         )
         self.source_combo.grid(row=0, column=1, sticky="ew", padx=4, pady=2)
+        self.source_combo.bind("<<ComboboxSelected>>", self._on_endpoints_changed)
 
         ttk.Label(sd_frame, text="Hedef (D):").grid(row=1, column=0, sticky="w")
         self.dest_var = tk.StringVar()
@@ -634,6 +3534,7 @@ class QoSRoutingApp(tk.Tk):
             sd_frame, textvariable=self.dest_var, state="readonly"
         )
         self.dest_combo.grid(row=1, column=1, sticky="ew", padx=4, pady=2)
+        self.dest_combo.bind("<<ComboboxSelected>>", self._on_endpoints_changed)
 
         sd_frame.columnconfigure(1, weight=1)
 
@@ -695,6 +3596,7 @@ class QoSRoutingApp(tk.Tk):
             orient=tk.HORIZONTAL,
             variable=self.w_delay,
             style="Modern.Horizontal.TScale",
+            command=self._on_weights_changed,
         )
         self.slider_delay.pack(fill=tk.X, pady=2)
 
@@ -706,6 +3608,7 @@ class QoSRoutingApp(tk.Tk):
             orient=tk.HORIZONTAL,
             variable=self.w_rel,
             style="Modern.Horizontal.TScale",
+            command=self._on_weights_changed,
         )
         self.slider_rel.pack(fill=tk.X, pady=2)
 
@@ -717,6 +3620,7 @@ class QoSRoutingApp(tk.Tk):
             orient=tk.HORIZONTAL,
             variable=self.w_res,
             style="Modern.Horizontal.TScale",
+            command=self._on_weights_changed,
         )
         self.slider_res.pack(fill=tk.X, pady=2)
 
@@ -736,6 +3640,17 @@ class QoSRoutingApp(tk.Tk):
 
         self._update_weights_label()
 
+        # Atlas modu: S/D için ağırlık simpleksi arka planda hesaplanır,
+        # kaydırıcı hareketleri tablodan O(1) okunur (yalnızca Basit).
+        self.atlas_var = tk.BooleanVar(value=False)
+        self.atlas_check = ttk.Checkbutton(
+            weights_frame,
+            text="Atlas modu (Basit yol kaydırıcıyla canlı izlenir)",
+            variable=self.atlas_var,
+            command=self.on_atlas_toggle,
+        )
+        self.atlas_check.pack(anchor="w", pady=(2, 0))
+
         self.slider_delay.bind(
             "<ButtonRelease-1>", lambda e: self._update_weights_label()
         )
@@ -755,7 +3670,13 @@ class QoSRoutingApp(tk.Tk):
         )
         self.btn_compute.pack(fill=tk.X, pady=(0, 8))
 
-        for btn in (self.btn_generate, self.btn_compute, self.dark_btn):
+        for btn in (
+            self.btn_generate,
+            self.btn_save,
+            self.btn_load,
+            self.btn_compute,
+            self.dark_btn,
+        ):
             btn.bind("<Enter>", lambda e, b=btn: b.state(["active"]))
             btn.bind("<Leave>", lambda e, b=btn: b.state(["!active"]))
 
@@ -896,10 +3817,50 @@ class QoSRoutingApp(tk.Tk):
     def on_generate_network(self):
         self.G = generate_random_network(n_nodes=250, p=0.4)
         self.pos = nx.spring_layout(self.G, seed=42, k=0.25)
+        self._on_network_ready("Ağ başarıyla oluşturuldu.\n")
+
+    def on_save_network(self):
+        if self.G is None:
+            messagebox.showwarning("Uyarı", "Kaydedilecek bir ağ yok. Önce ağı oluşturun.")
+            return
+
+        path = filedialog.asksaveasfilename(
+            defaultextension=".npz",
+            filetypes=[("Ağ anlık görüntüsü", "*.npz")],
+        )
+        if not path:
+            return
+
+        save_network(path, self.G, self.pos)
+        messagebox.showinfo("Bilgi", f"Ağ kaydedildi:\n{path}")
+
+    def on_load_network(self):
+        path = filedialog.askopenfilename(filetypes=[("Ağ anlık görüntüsü", "*.npz")])
+        if not path:
+            return
+
+        try:
+            G, pos = load_network(path, networkx=True)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+            messagebox.showerror("Hata", f"Ağ yüklenemedi:\n{exc}")
+            return
 
+        if pos is None:
+            pos = nx.spring_layout(G, seed=42, k=0.25)
+
+        self.G = G
+        self.pos = pos
+        self._on_network_ready("Ağ dosyadan yüklendi.\n")
+
+    def _on_network_ready(self, header):
         self.selected_node = None
         self.last_path = None
         self.hover_node = None
+        self.route_cache = RouteCache(self.G)
+        # Aynı hedefe yapılan sonraki RL sorguları öğrenilmiş Q'dan başlar
+        self.q_store = QTableStore(self.G)
+        self._cancel_atlas()
+        self.atlas = None
 
         nodes = sorted(self.G.nodes())
         values = [str(n) for n in nodes]
@@ -913,9 +3874,12 @@ class QoSRoutingApp(tk.Tk):
 
         self._draw_graph()
 
+        if self.atlas_var.get():
+            self._start_atlas()
+
         self._write_results(
-            "Ağ başarıyla oluşturuldu.\n"
-            f"Düğüm sayısı: {len(self.G.nodes())}\n"
+            header
+            + f"Düğüm sayısı: {len(self.G.nodes())}\n"
             f"Kenar sayısı: {len(self.G.edges())}\n\n"
             "Kaynak (S) ve Hedef (D) seçip HESAPLA butonuna basınız.\n"
             "Fareyi bir düğüm üzerine getirdiğinizde, düğüm numarası gösterilir.\n"
@@ -1102,7 +4066,7 @@ class QoSRoutingApp(tk.Tk):
         )
         self.update_idletasks()
 
-        path = q_learning_shortest_path(
+        path, self.last_train_info = q_learning_shortest_path(
             G,
             source=s,
             target=d,
@@ -1115,6 +4079,8 @@ class QoSRoutingApp(tk.Tk):
             gamma=0.9,
             epsilon_start=1.0,
             epsilon_end=0.05,
+            return_info=True,
+            q_store=self.q_store,
         )
 
         if path is None:
@@ -1137,7 +4103,7 @@ class QoSRoutingApp(tk.Tk):
         )
         self.update_idletasks()
 
-        path = sarsa_shortest_path(
+        path, self.last_train_info = sarsa_shortest_path(
             G,
             source=s,
             target=d,
@@ -1150,6 +4116,8 @@ class QoSRoutingApp(tk.Tk):
             gamma=0.9,
             epsilon_start=1.0,
             epsilon_end=0.05,
+            return_info=True,
+            q_store=self.q_store,
         )
 
         if path is None:
@@ -1161,6 +4129,82 @@ class QoSRoutingApp(tk.Tk):
 
         return path
 
+    # ---------------- Atlas Modu ----------------
+
+    def on_atlas_toggle(self):
+        if self.atlas_var.get():
+            self._start_atlas()
+        else:
+            self._cancel_atlas()
+            self.atlas = None
+
+    def _on_endpoints_changed(self, event=None):
+        if self.atlas_var.get():
+            self._start_atlas()
+
+    def _cancel_atlas(self):
+        if self._atlas_cancel is not None:
+            self._atlas_cancel.set()
+            self._atlas_cancel = None
+
+    def _start_atlas(self):
+        self._cancel_atlas()
+        self.atlas = None
+        if self.G is None:
+            return
+        try:
+            s = int(self.source_var.get())
+            d = int(self.dest_var.get())
+        except ValueError:
+            return
+
+        # Dönüşüm (paylaşılan önbellek) ana iş parçacığında yapılır
+        Q = as_qos_graph(self.G)
+        cancel = threading.Event()
+        result = {}
+
+        def work():
+            try:
+                result["atlas"] = build_route_atlas(Q, s, d, cancel=cancel)
+            except (nx.NodeNotFound, ValueError) as exc:
+                result["error"] = exc
+
+        worker = threading.Thread(target=work, daemon=True)
+        self._atlas_cancel = cancel
+        worker.start()
+        self.after(100, self._poll_atlas, worker, result, cancel)
+
+    def _poll_atlas(self, worker, result, cancel):
+        # Tk nesnelerine yalnızca ana iş parçacığından dokunulur
+        if cancel.is_set():
+            return
+        if worker.is_alive():
+            self.after(100, self._poll_atlas, worker, result, cancel)
+            return
+
+        self._atlas_cancel = None
+        if "error" in result:
+            messagebox.showwarning("Uyarı", f"Atlas hazırlanamadı:\n{result['error']}")
+            return
+
+        self.atlas = result.get("atlas")
+        if self.atlas is None:
+            return
+        self._write_results(
+            f"Atlas hazır: S={self.atlas.source}, D={self.atlas.target}\n"
+            f"Ağırlık simpleksinde {len(self.atlas.paths)} farklı en iyi yol var.\n"
+            "Kaydırıcıları hareket ettirdikçe yol anında güncellenir.\n"
+        )
+        self._on_weights_changed()
+
+    def _on_weights_changed(self, value=None):
+        if self.atlas is None or self.atlas.stale or not self.atlas_var.get():
+            return
+        path = self.atlas.lookup(self.w_delay.get(), self.w_rel.get(), self.w_res.get())
+        if path is not None and path != self.last_path:
+            self.last_path = path
+            self._draw_graph(path=path)
+
     # ---------------- HESAPLA Butonu ----------------
 
     def on_compute(self):
@@ -1195,9 +4239,18 @@ class QoSRoutingApp(tk.Tk):
         w_res = s_raw / total
 
         alg = self.alg_var.get()
+        weights = (w_delay, w_rel, w_res)
 
+        self.last_train_info = None
         if alg.startswith("Basit"):
-            path = find_best_path_simple(self.G, s, d, w_delay, w_rel, w_res)
+            # Yalnızca belirlenimci yöntemin sonucu önbelleğe alınır; aynı
+            # S, D ve ağırlıklar için önceki yol yeniden kullanılır. Rastgele
+            # yöntemler (GA, ACO, RL) her tıklamada yeniden çalışır.
+            found, path = self.route_cache.lookup(s, d, weights, alg)
+            if not found:
+                path = find_best_path_simple(self.G, s, d, w_delay, w_rel, w_res)
+                if path is not None:
+                    self.route_cache.store(s, d, weights, path, alg)
         elif alg.startswith("Genetik"):
             path = self.run_genetic_algorithm(self.G, s, d, w_delay, w_rel, w_res)
         elif alg.startswith("Karınca"):
@@ -1231,6 +4284,11 @@ class QoSRoutingApp(tk.Tk):
         out.append(f"Güvenilirlik Maliyeti: {rel_cost:.4f}\n")
         out.append(f"Kaynak Maliyeti: {res_cost:.4f}\n")
         out.append(f"Toplam Maliyet: {total_cost:.4f}\n\n")
+        if self.last_train_info is not None:
+            out.append(
+                f"Eğitim: {self.last_train_info['episodes_run']} bölüm "
+                f"(durma: {self.last_train_info['stop_reason']})\n\n"
+            )
         out.append("Normalize Edilmiş Ağırlıklar (toplam=1):\n")
         out.append(
             f"Wdelay={w_delay:.2f}, Wrel={w_rel:.2f}, Wres={w_res:.2f}\n"